@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import os
+import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -9,13 +12,15 @@ from pydantic import ValidationError as PydanticValidationError
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
+from textual.coordinate import Coordinate
 from textual.events import Key
 from textual.reactive import reactive
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button, DataTable, Footer, Header, Input, Select, Static
 
 from .constants import CASE_TYPE_OPTIONS, ensure_case_type_options
-from .csv_tools import dedupe_cases, export_cases, import_cases
+from .csv_tools import dedupe_cases, export_cases, iter_import_cases
 from .data_store import CaseDataStore
 from .exceptions import CorruptDataError, DataLockError, MigrationError
 from .history import HistoryManager
@@ -33,6 +38,8 @@ STATUS_CHOICES = [
     ("Closed", "closed"),
 ]
 
+ACTIVE_STATUSES = frozenset({"open", "filed", "pre-filing"})
+
 
 class TextPrompt(ModalScreen[Optional[str]]):
     """Simple modal prompt returning user input."""
@@ -88,6 +95,24 @@ class ConfirmDialog(ModalScreen[bool]):
         self.dismiss(event.button.id == "confirm-ok")
 
 
+_confirm_dialog: Optional[ConfirmDialog] = None
+
+
+def _get_confirm_dialog(message: str) -> ConfirmDialog:
+    """Return the shared ConfirmDialog rebound to ``message``.
+
+    One dialog instance is reused across confirmations; compose re-reads
+    the message on every push, so only the text needs swapping instead
+    of rebuilding the container/buttons tree each time.
+    """
+    global _confirm_dialog
+    if _confirm_dialog is None:
+        _confirm_dialog = ConfirmDialog(message)
+    else:
+        _confirm_dialog._message = message
+    return _confirm_dialog
+
+
 class AddCaseDialog(ModalScreen[Optional[Dict[str, str]]]):
     def compose(self) -> ComposeResult:
         yield Container(
@@ -201,10 +226,36 @@ class CaseboardApp(App):
         self.table: Optional[DataTable] = None
         self.status_line: Optional[Static] = None
         self.validation_label: Optional[Static] = None
-        self.inputs: Dict[str, Input | Select] = {}
+        self.input_case_number: Optional[Input] = None
+        self.input_case_name: Optional[Input] = None
+        self.select_case_type: Optional[Select] = None
+        self.input_stage: Optional[Input] = None
+        self.select_attention: Optional[Select] = None
+        self.select_status: Optional[Select] = None
+        self.input_paralegal: Optional[Input] = None
+        self.input_focus: Optional[Input] = None
+        self.input_next_due: Optional[Input] = None
         self.actor = os.environ.get("USERNAME") or os.environ.get("USER") or "user"
         self.filter_text = ""
         self.dirty = False
+        # Serializes CaseDataStore access between save workers (and the
+        # shutdown flush); the store itself is not thread safe.
+        self._store_lock = threading.Lock()
+        self._row_key_order: List[str] = []
+        self._row_cache: Dict[str, tuple] = {}
+        self._token_cache: Dict[str, str] = {}
+        self._display_cache: Dict[str, tuple] = {}
+        self._pending_edits: Dict[str, Optional[str]] = {}
+        self._pending_flush_scheduled = False
+        self._last_status_text = ""
+        self._filter_timer: Optional[Timer] = None
+        self._dirty_since: Optional[float] = None
+        self._case_type_options: List[tuple] = list(CASE_TYPE_OPTIONS)
+        self._case_type_option_set: set = {value for _, value in CASE_TYPE_OPTIONS}
+        self._id_to_filtered_pos: Dict[str, int] = {}
+        self._count_total = 0
+        self._count_active = 0
+        self._count_attention = 0
 
     # ------------------------------------------------------------------
     # Layout & lifecycle
@@ -219,24 +270,24 @@ class CaseboardApp(App):
             with Vertical(id="editor-pane"):
                 yield Static("Case Editor", id="editor-title")
                 with Vertical(id="editor-fields"):
-                    self.inputs["case_number"] = Input(placeholder="Case Number", id="input-case-number")
-                    yield self.inputs["case_number"]
-                    self.inputs["case_name"] = Input(placeholder="Case Name", id="input-case-name")
-                    yield self.inputs["case_name"]
-                    self.inputs["case_type"] = Select(options=CASE_TYPE_OPTIONS, id="select-case-type")
-                    yield self.inputs["case_type"]
-                    self.inputs["stage"] = Input(placeholder="Stage", id="input-stage")
-                    yield self.inputs["stage"]
-                    self.inputs["attention"] = Select(options=ATTENTION_CHOICES, id="select-attention")
-                    yield self.inputs["attention"]
-                    self.inputs["status"] = Select(options=STATUS_CHOICES, id="select-status")
-                    yield self.inputs["status"]
-                    self.inputs["paralegal"] = Input(placeholder="Paralegal", id="input-paralegal")
-                    yield self.inputs["paralegal"]
-                    self.inputs["current_task"] = Input(placeholder="Next action", id="input-focus")
-                    yield self.inputs["current_task"]
-                    self.inputs["next_due"] = Input(placeholder="Next due YYYY-MM-DD", id="input-next-due")
-                    yield self.inputs["next_due"]
+                    self.input_case_number = Input(placeholder="Case Number", id="input-case-number")
+                    yield self.input_case_number
+                    self.input_case_name = Input(placeholder="Case Name", id="input-case-name")
+                    yield self.input_case_name
+                    self.select_case_type = Select(options=CASE_TYPE_OPTIONS, id="select-case-type")
+                    yield self.select_case_type
+                    self.input_stage = Input(placeholder="Stage", id="input-stage")
+                    yield self.input_stage
+                    self.select_attention = Select(options=ATTENTION_CHOICES, id="select-attention")
+                    yield self.select_attention
+                    self.select_status = Select(options=STATUS_CHOICES, id="select-status")
+                    yield self.select_status
+                    self.input_paralegal = Input(placeholder="Paralegal", id="input-paralegal")
+                    yield self.input_paralegal
+                    self.input_focus = Input(placeholder="Next action", id="input-focus")
+                    yield self.input_focus
+                    self.input_next_due = Input(placeholder="Next due YYYY-MM-DD", id="input-next-due")
+                    yield self.input_next_due
                 self.validation_label = Static("", id="validation")
                 yield self.validation_label
         self.status_line = Static("Loading…", id="status-line")
@@ -249,6 +300,7 @@ class CaseboardApp(App):
         self._configure_table()
         self._load_cases()
         self.set_interval(30.0, self._autosave_tick)
+        self.set_interval(2.0, self._debounced_save_tick)
 
     def _configure_table(self) -> None:
         assert self.table is not None
@@ -279,56 +331,158 @@ class CaseboardApp(App):
             return
 
         self.cases = [case.model_copy(deep=True) for case in model.cases]
-        self._rebuild_filter()
+        self._token_cache.clear()
+        self._display_cache.clear()
+        self._sync_case_type_options()
+        self._recount_status()
         self.history.clear()
-        self.history.snapshot(self.cases)
         self.auto_save_label = f"Saved {model.saved_at:%H:%M:%S}" if model.cases else "Loaded"
-        self._refresh_table()
-        self._select_row(0)
+        self._refresh_after_mutation(select_row=0)
         self._update_status("Loaded cases")
 
     def _persist(self, reason: str, *, force: bool = False) -> None:
+        self._flush_pending_edits()
         if not (self.dirty or force):
             return
-        try:
-            result = self.store.save(self.cases, actor=self.actor, action=reason)
-        except DataLockError as exc:
-            self._update_status(f"Save failed: {exc}")
-            self.bell()
+        # Snapshot the payloads so edits made while the save is in flight
+        # can't race the serialization, then write off the UI thread:
+        # under lock contention store.save blocks for up to lock_timeout.
+        cases = [case.model_copy(deep=True) for case in self.cases]
+        self.dirty = False
+        self._dirty_since = None
+
+        def _save() -> None:
+            try:
+                with self._store_lock:
+                    result = self.store.save(cases, actor=self.actor, action=reason)
+            except DataLockError as exc:
+                self.call_from_thread(self._on_save_failed, str(exc))
+                return
+            self.call_from_thread(self._on_save_done, result.saved_at)
+
+        self.run_worker(_save, thread=True, group="persist", exclusive=True)
+
+    def _on_save_done(self, saved_at: datetime) -> None:
+        self.auto_save_label = f"Saved {saved_at:%H:%M:%S}"
+
+    def _on_save_failed(self, message: str) -> None:
+        self._update_status(f"Save failed: {message}")
+        self.bell()
+        # Leave the data marked dirty so the next autosave retries.
+        self.dirty = True
+        if self._dirty_since is None:
+            self._dirty_since = time.monotonic()
+
+    def on_unmount(self) -> None:
+        # Last-chance synchronous flush: a save scheduled moments before
+        # quitting may have been cancelled with the worker pool.
+        self._flush_pending_edits()
+        pending_worker = any(
+            worker.group == "persist" and not worker.is_finished for worker in self.workers
+        )
+        if not (self.dirty or pending_worker):
             return
-        self.auto_save_label = f"Saved {result.saved_at:%H:%M:%S}"
+        try:
+            with self._store_lock:
+                self.store.save(self.cases, actor=self.actor, action="shutdown")
+        except DataLockError:
+            pass
         self.dirty = False
 
     def _autosave_tick(self) -> None:
         self._persist("autosave")
 
+    def _debounced_save_tick(self) -> None:
+        # Pick up pending field edits shortly after typing stops so edits
+        # never block on disk I/O but still land quickly.
+        if self.dirty and self._dirty_since is not None:
+            if time.monotonic() - self._dirty_since > 1.5:
+                self._persist("field-change")
+
     # ------------------------------------------------------------------
     # Table helpers
     # ------------------------------------------------------------------
-    def _refresh_table(self) -> None:
-        assert self.table is not None
-        table = self.table
-        table.clear()
-        for display_index, case_index in enumerate(self.filtered_indices):
-            case = self.cases[case_index]
+    _COLUMN_KEYS = (
+        "case_number",
+        "case_name",
+        "case_type",
+        "stage",
+        "attention",
+        "status",
+        "paralegal",
+        "current_task",
+        "next_due",
+    )
+
+    # Edits to fields outside this set need no table repaint.
+    _DISPLAYED_FIELDS = frozenset(_COLUMN_KEYS)
+
+    def _row_values(self, case: CasePayload) -> tuple:
+        source = (case.current_task, case.attention, case.next_due)
+        cached = self._display_cache.get(case.id)
+        if cached is not None and cached[0] == source:
+            focus_text, attention_label, next_due = cached[1]
+        else:
             attention_label = "Needs" if case.attention == "needs_attention" else "Waiting"
             next_due = case.next_due or "—"
             focus_text = (case.current_task or "").strip()
             if len(focus_text) > 60:
                 focus_text = focus_text[:57] + "…"
-            row_key = f"{case.id}-{case_index}"
-            table.add_row(
-                case.case_number,
-                case.case_name,
-                case.case_type,
-                case.stage,
-                attention_label,
-                case.status,
-                case.paralegal,
-                focus_text,
-                next_due,
-                key=row_key,
-            )
+            self._display_cache[case.id] = (source, (focus_text, attention_label, next_due))
+        return (
+            case.case_number,
+            case.case_name,
+            case.case_type,
+            case.stage,
+            attention_label,
+            case.status,
+            case.paralegal,
+            focus_text,
+            next_due,
+        )
+
+    @staticmethod
+    def _is_subsequence(candidate: List[str], reference: List[str]) -> bool:
+        it = iter(reference)
+        return all(key in it for key in candidate)
+
+    def _refresh_table(self) -> None:
+        assert self.table is not None
+        table = self.table
+
+        new_keys: List[str] = []
+        new_cache: Dict[str, tuple] = {}
+        for case_index in self.filtered_indices:
+            case = self.cases[case_index]
+            new_keys.append(case.id)
+            new_cache[case.id] = self._row_values(case)
+
+        old_keys = self._row_key_order
+        old_cache = self._row_cache
+
+        if new_keys == old_keys:
+            # Same rows in the same order: touch only changed cells.
+            self._update_changed_cells(new_keys, old_cache, new_cache)
+        elif self._is_subsequence(new_keys, old_keys):
+            # Rows were removed (e.g. narrowing filter): drop the missing ones.
+            keep = set(new_keys)
+            for row_key in old_keys:
+                if row_key not in keep:
+                    table.remove_row(row_key)
+            self._update_changed_cells(new_keys, old_cache, new_cache)
+        elif len(new_keys) > len(old_keys) and new_keys[: len(old_keys)] == old_keys:
+            # Rows were appended (e.g. add case, widening filter to a superset).
+            for row_key in new_keys[len(old_keys):]:
+                table.add_row(*new_cache[row_key], key=row_key)
+            self._update_changed_cells(old_keys, old_cache, new_cache)
+        else:
+            # Order changed in a way the DataTable cannot patch: rebuild.
+            table.clear()
+            for row_key in new_keys:
+                table.add_row(*new_cache[row_key], key=row_key)
+
+        self._row_key_order = new_keys
+        self._row_cache = new_cache
 
         if self.filtered_indices:
             self.selected_row = max(0, min(self.selected_row, len(self.filtered_indices) - 1))
@@ -336,9 +490,43 @@ class CaseboardApp(App):
             table.move_cursor(row=self.selected_row, column=0, animate=False, scroll=True)
         else:
             table.show_cursor = False
+
+    def _refresh_after_mutation(
+        self,
+        *,
+        focus_id: Optional[str] = None,
+        select_row: Optional[int] = None,
+    ) -> None:
+        """Rebuild the filter and repaint in a single coalesced layout pass."""
+        with self.batch_update():
+            self._rebuild_filter()
+            self._refresh_table()
+            if focus_id is not None:
+                self._focus_case(focus_id)
+            elif select_row is not None:
+                self._select_row(select_row)
         self.refresh(layout=True)
 
+    def _update_changed_cells(
+        self,
+        row_keys: List[str],
+        old_cache: Dict[str, tuple],
+        new_cache: Dict[str, tuple],
+    ) -> None:
+        assert self.table is not None
+        table = self.table
+        for row_key in row_keys:
+            old_row = old_cache.get(row_key)
+            new_row = new_cache[row_key]
+            if old_row == new_row:
+                continue
+            for column_key, old_value, new_value in zip(self._COLUMN_KEYS, old_row or (), new_row):
+                if old_value != new_value:
+                    table.update_cell(row_key, column_key, new_value, update_width=True)
+
     def _select_row(self, position: int, *, update_cursor: bool = True) -> None:
+        # Apply buffered edits against the outgoing selection first.
+        self._flush_pending_edits()
         if not self.filtered_indices:
             self.selected_row = 0
             self._populate_editor(None)
@@ -350,107 +538,166 @@ class CaseboardApp(App):
         self._populate_editor(case)
 
     def _focus_case(self, case_id: str) -> None:
-        for pos, index in enumerate(self.filtered_indices):
-            if self.cases[index].id == case_id:
-                self.selected_row = pos
-                self._select_row(pos)
-                return
-        self._select_row(0)
+        pos = self._id_to_filtered_pos.get(case_id)
+        if pos is None:
+            self._select_row(0)
+            return
+        # _select_row owns the selected_row update; assigning it here first
+        # would make the flush inside resolve buffered edits against the
+        # incoming selection instead of the outgoing one.
+        self._select_row(pos)
 
     def _populate_editor(self, case: Optional[CasePayload]) -> None:
         if case is None:
-            for widget in self.inputs.values():
-                if isinstance(widget, Input):
-                    widget.value = ""
-                elif isinstance(widget, Select):
-                    widget.value = None
+            for input_widget in (
+                self.input_case_number,
+                self.input_case_name,
+                self.input_stage,
+                self.input_paralegal,
+                self.input_focus,
+                self.input_next_due,
+            ):
+                if input_widget is not None and input_widget.value:
+                    input_widget.value = ""
+            for select_widget in (self.select_case_type, self.select_attention, self.select_status):
+                if select_widget is not None and select_widget.value is not None:
+                    select_widget.value = None
             if self.validation_label:
                 self.validation_label.update("")
             return
 
-        if isinstance(self.inputs["case_number"], Input):
-            self.inputs["case_number"].value = case.case_number  # type: ignore[assignment]
-        if isinstance(self.inputs["case_name"], Input):
-            self.inputs["case_name"].value = case.case_name  # type: ignore[assignment]
-        if isinstance(self.inputs["case_type"], Select):
-            # Only update options if they might have changed
-            current_options = self.inputs["case_type"]._options  # type: ignore[attr-defined]
-            if not current_options or case.case_type not in [opt[1] for opt in current_options]:
-                options = ensure_case_type_options([c.case_type for c in self.cases])
-                self.inputs["case_type"].set_options(options)
-            self.inputs["case_type"].value = case.case_type  # type: ignore[assignment]
-        if isinstance(self.inputs["stage"], Input):
-            self.inputs["stage"].value = case.stage  # type: ignore[assignment]
-        if isinstance(self.inputs["attention"], Select):
-            self.inputs["attention"].value = case.attention  # type: ignore[assignment]
-        if isinstance(self.inputs["status"], Select):
-            self.inputs["status"].value = case.status  # type: ignore[assignment]
-        if isinstance(self.inputs["paralegal"], Input):
-            self.inputs["paralegal"].value = case.paralegal  # type: ignore[assignment]
-        if isinstance(self.inputs["current_task"], Input):
-            self.inputs["current_task"].value = case.current_task  # type: ignore[assignment]
-        if isinstance(self.inputs["next_due"], Input):
-            self.inputs["next_due"].value = case.next_due or ""  # type: ignore[assignment]
+        if case.case_type and case.case_type not in self._case_type_option_set:
+            self._add_case_type_option(case.case_type)
+        desired = (
+            (self.input_case_number, case.case_number),
+            (self.input_case_name, case.case_name),
+            (self.select_case_type, case.case_type),
+            (self.input_stage, case.stage),
+            (self.select_attention, case.attention),
+            (self.select_status, case.status),
+            (self.input_paralegal, case.paralegal),
+            (self.input_focus, case.current_task),
+            (self.input_next_due, case.next_due or ""),
+        )
+        # Write only the widgets whose value actually changed so arrow-key
+        # scrolling does not fire nine Changed events per row.
+        for widget, value in desired:
+            if widget is not None and widget.value != value:
+                widget.value = value  # type: ignore[assignment]
         if self.validation_label:
             self.validation_label.update("")
 
+    def _add_case_type_option(self, value: str) -> None:
+        self._case_type_options.append((value, value))
+        self._case_type_option_set.add(value)
+        if self.select_case_type is not None:
+            self.select_case_type.set_options(self._case_type_options)
+
+    def _sync_case_type_options(self) -> None:
+        """Recompute dropdown options after bulk mutations of the case list."""
+        options = ensure_case_type_options(case.case_type for case in self.cases)
+        option_set = {value for _, value in options}
+        if option_set == self._case_type_option_set:
+            return
+        self._case_type_options = list(options)
+        self._case_type_option_set = option_set
+        if self.select_case_type is not None:
+            self.select_case_type.set_options(options)
+
     def _case_tokens(self, case: CasePayload) -> str:
-        parts = [
-            case.case_number,
-            case.case_name,
-            case.case_type,
-            case.stage,
-            case.paralegal,
-            case.current_task,
-            case.status,
-        ]
-        return " ".join(filter(None, parts)).lower()
+        haystack = self._token_cache.get(case.id)
+        if haystack is None:
+            parts = [
+                case.case_number,
+                case.case_name,
+                case.case_type,
+                case.stage,
+                case.paralegal,
+                case.current_task,
+                case.status,
+            ]
+            haystack = " ".join(filter(None, parts)).lower()
+            self._token_cache[case.id] = haystack
+        return haystack
 
     def _rebuild_filter(self) -> None:
         if not self.filter_text:
             self.filtered_indices = list(range(len(self.cases)))
-            return
-        tokens = self.filter_text.split()
-        matches: List[int] = []
-        for idx, case in enumerate(self.cases):
-            haystack = self._case_tokens(case)
-            if all(token in haystack for token in tokens):
-                matches.append(idx)
-        self.filtered_indices = matches
+        else:
+            # One compiled lookahead per token moves the substring scan
+            # into C instead of a Python all(...) loop per case.
+            search = re.compile(
+                "".join(f"(?=.*{re.escape(token)})" for token in self.filter_text.split()),
+                re.S,
+            ).search
+            case_tokens = self._case_tokens
+            self.filtered_indices = [
+                idx for idx, case in enumerate(self.cases) if search(case_tokens(case))
+            ]
+        self._id_to_filtered_pos = {
+            self.cases[index].id: pos for pos, index in enumerate(self.filtered_indices)
+        }
 
     # ------------------------------------------------------------------
     # Editing handlers
     # ------------------------------------------------------------------
     def on_input_blurred(self, event: Input.Blurred) -> None:
-        try:
-            self._apply_change(event.input.id, event.value)
-        except Exception as exc:
-            # Prevent crashes from unexpected errors during field updates
-            if self.validation_label:
-                self.validation_label.update(f"Error: {exc}")
-            self.bell()
+        self._queue_change(event.input.id, event.value)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        try:
-            self._apply_change(event.input.id, event.value)
-        except Exception as exc:
-            # Prevent crashes from unexpected errors during field updates
-            if self.validation_label:
-                self.validation_label.update(f"Error: {exc}")
-            self.bell()
+        self._queue_change(event.input.id, event.value)
 
     def on_select_changed(self, event: Select.Changed) -> None:
-        try:
-            self._apply_change(event.select.id, event.value)
-        except Exception as exc:
-            # Prevent crashes from unexpected errors during field updates
-            if self.validation_label:
-                self.validation_label.update(f"Error: {exc}")
-            self.bell()
+        self._queue_change(event.select.id, event.value)
+
+    def _queue_change(self, widget_id: str | None, value: Optional[str]) -> None:
+        """Buffer an editor change and flush once after the current refresh.
+
+        Tabbing through the editor fires one blur per field; buffering
+        collapses those into a single validate/repaint/status pass.
+        """
+        if not widget_id:
+            return
+        self._pending_edits[widget_id] = value
+        if not self._pending_flush_scheduled:
+            self._pending_flush_scheduled = True
+            self.call_after_refresh(self._flush_pending_edits)
+
+    def _flush_pending_edits(self) -> None:
+        self._pending_flush_scheduled = False
+        if not self._pending_edits:
+            return
+        pending, self._pending_edits = self._pending_edits, {}
+        applied = None
+        for widget_id, value in pending.items():
+            try:
+                result = self._apply_field(widget_id, value)
+            except Exception as exc:
+                # Prevent crashes from unexpected errors during field updates
+                if self.validation_label:
+                    self.validation_label.update(f"Error: {exc}")
+                self.bell()
+                continue
+            if result is not None:
+                applied = result
+        self._finish_edit(applied)
 
     def _apply_change(self, widget_id: str | None, value: Optional[str]) -> None:
-        if not widget_id or not self.filtered_indices:
+        self._finish_edit(self._apply_field(widget_id, value))
+
+    def _finish_edit(self, applied: Optional[tuple]) -> None:
+        if applied is None:
             return
+        field, target_id = applied
+        if field in self._DISPLAYED_FIELDS:
+            self._refresh_after_mutation(focus_id=target_id)
+        self._dirty_since = time.monotonic()
+        self._update_status(f"Updated {field}")
+
+    def _apply_field(self, widget_id: str | None, value: Optional[str]) -> Optional[tuple]:
+        """Validate and apply one field edit; return (field, case id) on success."""
+        if not widget_id or not self.filtered_indices:
+            return None
         field_map = {
             "input-case-number": "case_number",
             "input-case-name": "case_name",
@@ -464,34 +711,49 @@ class CaseboardApp(App):
         }
         field = field_map.get(widget_id)
         if not field:
-            return
+            return None
 
         case_index = self.filtered_indices[self.selected_row]
         current = self.cases[case_index]
-        update_payload = {field: value or ""}
+        new_value: Optional[str] = value or ""
         if field == "next_due" and not value:
-            update_payload[field] = None
+            new_value = None
+        old_value = getattr(current, field)
 
         try:
-            updated = current.model_copy(update=update_payload)
-        except PydanticValidationError as exc:
-            message = exc.errors()[0]["msg"] if exc.errors() else str(exc)
+            current.assign_field(field, new_value)
+        except ValueError as exc:
+            # Field cleaners raise plain ValueError; pydantic's
+            # ValidationError subclasses it but carries richer messages.
+            if isinstance(exc, PydanticValidationError):
+                message = exc.errors()[0]["msg"] if exc.errors() else str(exc)
+            else:
+                message = str(exc)
             if self.validation_label:
                 self.validation_label.update(message)
             self.bell()
-            return
+            return None
+
+        if getattr(current, field) == old_value:
+            # Blur fires even when nothing changed; skip the no-op.
+            return None
 
-        target_id = updated.id
-        self.history.snapshot(self.cases)
-        self.cases[case_index] = updated
+        target_id = current.id
+        self.history.push_edit(case_index, field, old_value, getattr(current, field))
+        if field == "status":
+            self._count_active += (current.status in ACTIVE_STATUSES) - (
+                old_value in ACTIVE_STATUSES
+            )
+        elif field == "attention":
+            self._count_attention += (current.attention == "needs_attention") - (
+                old_value == "needs_attention"
+            )
+        self._token_cache.pop(target_id, None)
+        self._display_cache.pop(target_id, None)
         self.dirty = True
         if self.validation_label:
             self.validation_label.update("")
-        self._rebuild_filter()
-        self._refresh_table()
-        self._focus_case(target_id)
-        self._persist("field-change", force=True)
-        self._update_status(f"Updated {field}")
+        return (field, target_id)
 
     # ------------------------------------------------------------------
     # Actions
@@ -512,36 +774,33 @@ class CaseboardApp(App):
                 next_due=None,
                 deadlines=[],
             )
-            self.history.snapshot(self.cases)
             self.cases.append(payload)
+            self.history.push_add(len(self.cases) - 1, payload)
+            self._count_total += 1
+            self._count_active += payload.status in ACTIVE_STATUSES
+            self._count_attention += payload.attention == "needs_attention"
             self.dirty = True
             self.filter_text = ""
-            self._rebuild_filter()
-            self.selected_row = len(self.filtered_indices) - 1
-            self._refresh_table()
-            self._focus_case(payload.id)
+            self._refresh_after_mutation(focus_id=payload.id)
             self._persist("add-case", force=True)
             self._update_status(f"Added {payload.case_number}")
 
         self.push_screen(AddCaseDialog(), _complete)
 
     def action_edit_field(self) -> None:
-        widget = self.inputs.get("current_task")
-        if isinstance(widget, Input):
-            widget.focus()
+        if self.input_focus is not None:
+            self.input_focus.focus()
 
     def action_quick_focus(self) -> None:
         if not self.filtered_indices:
             return
-        current_value = ""
-        widget = self.inputs.get("current_task")
-        if isinstance(widget, Input):
-            current_value = widget.value
+        widget = self.input_focus
+        current_value = widget.value if widget is not None else ""
 
         def _complete(value: Optional[str]) -> None:
             if value is None:
                 return
-            if isinstance(widget, Input):
+            if widget is not None:
                 widget.value = value
             self._apply_change("input-focus", value)
 
@@ -573,56 +832,69 @@ class CaseboardApp(App):
         def _done(result: bool) -> None:
             if not result:
                 return
-            self.history.snapshot(self.cases)
-            self.cases.pop(self.filtered_indices[self.selected_row])
+            case_index = self.filtered_indices[self.selected_row]
+            removed = self.cases.pop(case_index)
+            self.history.push_delete(case_index, removed)
+            self._count_total -= 1
+            self._count_active -= removed.status in ACTIVE_STATUSES
+            self._count_attention -= removed.attention == "needs_attention"
             self.dirty = True
-            self._rebuild_filter()
-            self.selected_row = min(self.selected_row, len(self.filtered_indices) - 1)
-            self._refresh_table()
-            self._select_row(self.selected_row)
+            self._refresh_after_mutation(select_row=self.selected_row)
             self._persist("delete", force=True)
             self._update_status(f"Deleted {case.case_number}")
 
-        self.push_screen(ConfirmDialog(f"Delete {case.case_number}?"), _done)
+        self.push_screen(_get_confirm_dialog(f"Delete {case.case_number}?"), _done)
 
     def action_filter_cases(self) -> None:
         def _complete(value: Optional[str]) -> None:
             self.filter_text = (value or "").strip().lower()
-            self._rebuild_filter()
-            self.selected_row = 0
-            self._refresh_table()
-            self._select_row(0)
-            self._update_status(f"Filter '{self.filter_text}'" if self.filter_text else "Filter cleared")
+            self._schedule_filter_apply()
 
         self.push_screen(TextPrompt("Filter cases", initial=self.filter_text), _complete)
 
+    def _schedule_filter_apply(self) -> None:
+        # Coalesce rapid filter changes so only the last one rebuilds the table.
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(0.08, self._apply_filter_now)
+
+    def _apply_filter_now(self) -> None:
+        self._filter_timer = None
+        self.selected_row = 0
+        self._refresh_after_mutation(select_row=0)
+        self._update_status(f"Filter '{self.filter_text}'" if self.filter_text else "Filter cleared")
+
     def action_save_now(self) -> None:
         self._persist("manual", force=True)
         self._update_status("Saved")
 
     def action_undo(self) -> None:
-        snapshot = self.history.undo(self.cases)
-        if snapshot is None:
+        # Buffered edits must land (and enter history) before the list
+        # mutates, or they'd resolve against post-mutation indices.
+        self._flush_pending_edits()
+        if not self.history.undo(self.cases):
             self.bell()
             return
-        self.cases = [case.model_copy(deep=True) for case in snapshot]
         self.dirty = True
-        self._rebuild_filter()
-        self._refresh_table()
-        self._select_row(self.selected_row)
+        self._token_cache.clear()
+        self._display_cache.clear()
+        self._sync_case_type_options()
+        self._recount_status()
+        self._refresh_after_mutation(select_row=self.selected_row)
         self._persist("undo", force=True)
         self._update_status("Undo")
 
     def action_redo(self) -> None:
-        snapshot = self.history.redo(self.cases)
-        if snapshot is None:
+        self._flush_pending_edits()
+        if not self.history.redo(self.cases):
             self.bell()
             return
-        self.cases = [case.model_copy(deep=True) for case in snapshot]
         self.dirty = True
-        self._rebuild_filter()
-        self._refresh_table()
-        self._select_row(self.selected_row)
+        self._token_cache.clear()
+        self._display_cache.clear()
+        self._sync_case_type_options()
+        self._recount_status()
+        self._refresh_after_mutation(select_row=self.selected_row)
         self._persist("redo", force=True)
         self._update_status("Redo")
 
@@ -633,6 +905,8 @@ class CaseboardApp(App):
         self._reorder_case(1)
 
     def _reorder_case(self, delta: int) -> None:
+        # Resolve buffered edits against pre-move indices, as _persist does.
+        self._flush_pending_edits()
         if self.filter_text:
             self._update_status("Clear filter to reorder")
             self.bell()
@@ -644,50 +918,91 @@ class CaseboardApp(App):
         if target_index < 0 or target_index >= len(self.cases):
             return
 
-        self.history.snapshot(self.cases)
-        case = self.cases.pop(source_index)
-        if target_index > source_index:
-            target_index -= 1
-        self.cases.insert(target_index, case)
+        cases = self.cases
+        cases[source_index], cases[target_index] = cases[target_index], cases[source_index]
+        self.history.push_move(source_index, target_index)
         self.dirty = True
-        self._rebuild_filter()
-        self._refresh_table()
-        self._focus_case(case.id)
+        # No filter is active here, so filtered_indices is the identity
+        # mapping; only the two swapped positions change in the id lookup.
+        self._id_to_filtered_pos[cases[source_index].id] = source_index
+        self._id_to_filtered_pos[cases[target_index].id] = target_index
+        self._swap_table_rows(source_index, target_index)
+        self._select_row(target_index)
         self._persist("reorder", force=True)
         self._update_status("Reordered cases")
 
+    def _swap_table_rows(self, source_index: int, target_index: int) -> None:
+        """Repaint only the two rows involved in an adjacent swap.
+
+        The DataTable cannot move a row, so both rows keep their physical
+        keys and their cells are overwritten in place. The cached key order
+        still reflects the table's layout; the next structural refresh
+        notices the order change and rebuilds.
+        """
+        assert self.table is not None
+        table = self.table
+        for row in (source_index, target_index):
+            values = self._row_values(self.cases[row])
+            for column, value in enumerate(values):
+                table.update_cell_at(Coordinate(row, column), value, update_width=True)
+            self._row_cache[self._row_key_order[row]] = values
+
     def action_import_csv(self) -> None:
         def _complete(path_str: Optional[str]) -> None:
             if not path_str:
                 return
+            index_map: Optional[Dict[str, int]] = None
+            backup: Optional[List[CasePayload]] = None
+            last_case_id = ""
+            imported_count = 0
             try:
-                imported = import_cases(Path(path_str).expanduser())
+                for payload in iter_import_cases(Path(path_str).expanduser()):
+                    if index_map is None:
+                        # First row: back up the current list before merging.
+                        backup = list(self.cases)
+                        self.history.push_bulk(backup)
+                        index_map = {
+                            case.case_number: idx for idx, case in enumerate(self.cases)
+                        }
+                    if payload.case_number in index_map:
+                        idx = index_map[payload.case_number]
+                        payload.id = self.cases[idx].id
+                        self.cases[idx] = payload
+                    else:
+                        self.cases.append(payload)
+                        index_map[payload.case_number] = len(self.cases) - 1
+                    last_case_id = payload.id
+                    imported_count += 1
             except FileNotFoundError:
                 self._update_status("CSV not found")
                 self.bell()
                 return
-            if not imported:
+            except ValueError as exc:
+                # iter_import_cases raises mid-iteration on a malformed row;
+                # restore the snapshot so the import stays all-or-nothing
+                # like the pre-streaming version, and drop the aborted
+                # import's history entry.
+                if backup is not None:
+                    self.cases[:] = backup
+                    self.history.discard_last()
+                if isinstance(exc, PydanticValidationError):
+                    message = exc.errors()[0]["msg"] if exc.errors() else str(exc)
+                else:
+                    message = str(exc)
+                self._update_status(f"Import failed: {message}")
+                self.bell()
+                return
+            if index_map is None:
                 self._update_status("No cases imported")
                 return
-            self.history.snapshot(self.cases)
-            index_map = {case.case_number: idx for idx, case in enumerate(self.cases)}
-            last_case_id = imported[-1].id
-            for payload in imported:
-                if payload.case_number in index_map:
-                    idx = index_map[payload.case_number]
-                    payload.id = self.cases[idx].id
-                    self.cases[idx] = payload
-                else:
-                    self.cases.append(payload)
-                    index_map[payload.case_number] = len(self.cases) - 1
-                    last_case_id = payload.id
             self.dirty = True
-            self._rebuild_filter()
-            self._refresh_table()
-            if self.filtered_indices:
-                self._focus_case(last_case_id)
+            self._token_cache.clear()
+            self._display_cache.clear()
+            self._sync_case_type_options()
+            self._recount_status()
+            self._refresh_after_mutation(focus_id=last_case_id)
             self._persist("import", force=True)
-            self._update_status(f"Imported {len(imported)} cases")
+            self._update_status(f"Imported {imported_count} cases")
 
         self.push_screen(TextPrompt("Import CSV path", placeholder="C:/path/to/cases.csv"), _complete)
 
@@ -696,8 +1011,13 @@ class CaseboardApp(App):
             if not path_str:
                 return
             path = Path(path_str).expanduser()
-            export_cases(path, self.cases)
-            self._update_status(f"Exported to {path}")
+            cases = list(self.cases)
+
+            def _export() -> None:
+                export_cases(path, cases)
+                self.call_from_thread(self._update_status, f"Exported to {path}")
+
+            self.run_worker(_export, thread=True, group="csv-export", exclusive=True)
 
         self.push_screen(TextPrompt("Export CSV path", placeholder="C:/path/to/export.csv"), _complete)
 
@@ -706,16 +1026,14 @@ class CaseboardApp(App):
         if len(deduped) == len(self.cases):
             self._update_status("No duplicates found")
             return
-        self.history.snapshot(self.cases)
+        self.history.push_bulk(self.cases)
         self.cases = deduped
         self.dirty = True
-        self._rebuild_filter()
-        self._refresh_table()
-        if self.filtered_indices:
-            focus_id = self.cases[self.filtered_indices[0]].id
-            self._focus_case(focus_id)
-        else:
-            self._populate_editor(None)
+        self._token_cache.clear()
+        self._display_cache.clear()
+        self._sync_case_type_options()
+        self._recount_status()
+        self._refresh_after_mutation(select_row=0)
         self._persist("dedupe", force=True)
         self._update_status("Removed duplicate case numbers")
 
@@ -731,15 +1049,31 @@ class CaseboardApp(App):
     # ------------------------------------------------------------------
     # Status line
     # ------------------------------------------------------------------
+    def _recount_status(self) -> None:
+        """Recompute status-line counters in one pass after a bulk mutation."""
+        active = 0
+        attention = 0
+        for case in self.cases:
+            if case.status in ACTIVE_STATUSES:
+                active += 1
+            if case.attention == "needs_attention":
+                attention += 1
+        self._count_total = len(self.cases)
+        self._count_active = active
+        self._count_attention = attention
+
     def _update_status(self, message: str) -> None:
         if not self.status_line:
             return
-        total = len(self.cases)
-        active = sum(1 for case in self.cases if case.status in {"open", "filed", "pre-filing"})
-        attention = sum(1 for case in self.cases if case.attention == "needs_attention")
-        self.status_line.update(
-            f"{message} • Total {total} • Active {active} • Needs {attention} • {self.auto_save_label}"
+        text = (
+            f"{message} • Total {self._count_total} • Active {self._count_active}"
+            f" • Needs {self._count_attention} • {self.auto_save_label}"
         )
+        if text == self._last_status_text:
+            # Identical content: skip the Static re-render.
+            return
+        self._last_status_text = text
+        self.status_line.update(text)
 
 
 __all__ = ["CaseboardApp"]
\ No newline at end of file
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Tuple
 
 # Canonical list of case types available in the UI (label, value)
-CASE_TYPE_OPTIONS: List[Tuple[str, str]] = [
+CASE_TYPE_OPTIONS: Tuple[Tuple[str, str], ...] = (
     ("Personal Injury", "Personal Injury"),
     ("MVA", "MVA"),
     ("Wrongful Death", "Wrongful Death"),
@@ -14,9 +14,9 @@ CASE_TYPE_OPTIONS: List[Tuple[str, str]] = [
     ("Divorce", "Divorce"),
     ("Environmental", "Environmental"),
     ("Other", "Other"),
-]
+)
 
-CASE_TYPE_VALUES = {value for _, value in CASE_TYPE_OPTIONS}
+CASE_TYPE_VALUES: frozenset = frozenset(value for _, value in CASE_TYPE_OPTIONS)
 
 # Color palette for case types, using high-contrast hex values tuned for the dashboards.
 CASE_TYPE_COLOR_MAP: Dict[str, str] = {
@@ -43,17 +43,25 @@ CASE_TYPE_ALIASES: Dict[str, str] = {
 }
 
 
+# Canonical values map to themselves so normalization is one dict lookup.
+_TYPE_TABLE: Dict[str, str] = {value: value for value in CASE_TYPE_VALUES}
+_TYPE_TABLE.update(CASE_TYPE_ALIASES)
+
+
 def normalize_case_type(case_type: str) -> str:
     """Return the canonical case type label for a stored value."""
-    return CASE_TYPE_ALIASES.get(case_type, case_type)
-
-
-def ensure_case_type_options(existing: Iterable[str]) -> List[Tuple[str, str]]:
-    """Return UI options including the canonical list plus any legacy values in use."""
-    options = list(CASE_TYPE_OPTIONS)
-    seen = {value for _, value in options}
-    for value in existing:
-        if value and value not in seen:
-            options.append((value, value))
-            seen.add(value)
-    return options
+    return _TYPE_TABLE.get(case_type, case_type)
+
+
+def ensure_case_type_options(existing: Iterable[str]) -> Tuple[Tuple[str, str], ...]:
+    """Return UI options including the canonical list plus any legacy values in use.
+
+    The returned tuple is shared with ``CASE_TYPE_OPTIONS`` when no legacy
+    values are present; callers that need a mutable list must copy it.
+    """
+    extras = [
+        value for value in dict.fromkeys(existing) if value and value not in CASE_TYPE_VALUES
+    ]
+    if not extras:
+        return CASE_TYPE_OPTIONS
+    return CASE_TYPE_OPTIONS + tuple((value, value) for value in extras)
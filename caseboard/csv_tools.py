@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import csv
+import operator
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Tuple
 
 from .schema import CasePayload
 
@@ -18,43 +19,63 @@ CSV_FIELDS = [
     "next_due",
 ]
 
+# 64 KB IO buffer keeps syscall counts low on large imports/exports.
+CSV_BUFFER_SIZE = 1 << 16
+
+_EXPORT_GETTER = operator.attrgetter(*CSV_FIELDS)
+
+
+def _export_row(case: CasePayload) -> Tuple[str, ...]:
+    return tuple(value or "" for value in _EXPORT_GETTER(case))
+
 
 def export_cases(path: Path, cases: Iterable[CasePayload]) -> Path:
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=CSV_FIELDS)
-        writer.writeheader()
-        for case in cases:
-            row = {field: getattr(case, field) or "" for field in CSV_FIELDS}
-            writer.writerow(row)
+    with path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(CSV_FIELDS)
+        writer.writerows(map(_export_row, cases))
     return path
 
 
-def import_cases(path: Path) -> List[CasePayload]:
+def iter_import_cases(path: Path) -> Iterator[CasePayload]:
+    """Yield cases from a CSV one at a time without materializing the file."""
     path = Path(path)
-    cases: List[CasePayload] = []
-    with path.open("r", newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
+    with path.open("r", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        # Resolve column positions once instead of a dict per row.
+        positions = {name: index for index, name in enumerate(header)}
+        indices = [positions.get(field, -1) for field in CSV_FIELDS]
         for row in reader:
-            payload = CasePayload(
-                case_number=row.get("case_number", ""),
-                case_name=row.get("case_name", ""),
-                case_type=row.get("case_type", ""),
-                stage=row.get("stage", ""),
-                attention=row.get("attention", "waiting"),
-                status=row.get("status", "open"),
-                paralegal=row.get("paralegal", ""),
-                current_task=row.get("current_task", ""),
-                next_due=row.get("next_due") or None,
+            width = len(row)
+            number, name, case_type, stage, attention, status, paralegal, task, next_due = (
+                row[index] if 0 <= index < width else "" for index in indices
+            )
+            yield CasePayload(
+                case_number=number,
+                case_name=name,
+                case_type=case_type,
+                stage=stage,
+                attention=attention or "waiting",
+                status=status or "open",
+                paralegal=paralegal,
+                current_task=task,
+                next_due=next_due or None,
                 deadlines=[],
             )
-            cases.append(payload)
-    return cases
+
+
+def import_cases(path: Path) -> List[CasePayload]:
+    return list(iter_import_cases(path))
 
 
 def dedupe_cases(cases: Iterable[CasePayload]) -> List[CasePayload]:
     seen: dict[str, CasePayload] = {}
+    keep_first = seen.setdefault
     for case in cases:
-        seen.setdefault(case.case_number, case)
+        keep_first(case.case_number, case)
     return list(seen.values())
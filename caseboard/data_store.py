@@ -1,19 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import heapq
 import json
+import operator
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from filelock import FileLock, Timeout
 from pydantic import ValidationError as PydanticValidationError
+from pydantic.type_adapter import TypeAdapter
 
 from .exceptions import CorruptDataError, DataLockError, MigrationError, ValidationError
 from .focus_log import FocusLogManager
 from .schema import APP_SCHEMA_VERSION, CaseFileModel, CasePayload
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_dumps(payload: object) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available.
+
+    Compact output roughly halves the bytes written on every save; the
+    human-readable variant is reserved for migration artifacts.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: "bytes | str") -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 DATA_DIR = Path("data")
 BACKUP_DIR = DATA_DIR / "backups"
 MIGRATIONS_DIR = DATA_DIR / "migrations"
@@ -22,10 +51,40 @@ AUDIT_LOG = DATA_DIR / "audit.log"
 BUMP_FILE = DATA_DIR / ".bump"
 CASES_FILE = DATA_DIR / "cases.json"
 
+# Above this combined size, migrations skip difflib and keep old/new copies.
+MIGRATION_DIFF_MAX_BYTES = 2 * 1024 * 1024
+
+# filelock's default 50 ms poll adds ~25 ms average latency per contended
+# acquire; poll tightly instead — saves are short, contention is brief.
+LOCK_POLL_INTERVAL = 0.001
+
+_SCHEMA_VERSION_RE = re.compile(rb'"schema_version"\s*:\s*(\d+)')
+
+_ACTIVE_STATUSES = frozenset({"open", "filed", "pre-filing"})
+
 BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 MIGRATIONS_DIR.mkdir(parents=True, exist_ok=True)
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+_CASE_LIST_ADAPTER = TypeAdapter(List[CasePayload])
+
+_DIFF_FIELDS = (
+    "case_name",
+    "case_type",
+    "stage",
+    "attention",
+    "status",
+    "paralegal",
+    "current_task",
+    "next_due",
+    "county",
+    "division",
+    "judge",
+    "opposing_counsel",
+    "opposing_firm",
+)
+_DIFF_GETTER = operator.attrgetter(*_DIFF_FIELDS)
+
 
 @dataclass
 class SaveResult:
@@ -44,40 +103,81 @@ class CaseDataStore:
         self.lock = FileLock(str(self.data_file.parent / lock_name))
         self.lock_timeout = lock_timeout
         self.current_model: Optional[CaseFileModel] = None
-        self.last_loaded_raw: Optional[str] = None
+        self.last_loaded_raw: Optional[bytes] = None
         self.focus_log_manager = FocusLogManager()
+        self._cached_stat: Optional[Tuple[int, int]] = None
+        self._last_summary_key: Optional[bytes] = None
+        self._last_payload_key: Optional[bytes] = None
+        self._audit_fh: Optional[BinaryIO] = None
+        self._backups_cache: Optional[Tuple[int, List[str]]] = None
+        self._backup_executor: Optional[ThreadPoolExecutor] = None
 
     # ------------------------------------------------------------------
     # Load / backup / migrations
     # ------------------------------------------------------------------
-    def load(self, *, create_backup: bool = True) -> CaseFileModel:
-        """Load the case file from disk with validation and migrations."""
+    def load(self, *, create_backup: bool = True, prefer_cache: bool = False) -> CaseFileModel:
+        """Load the case file from disk with validation and migrations.
+
+        With ``prefer_cache`` the previously parsed model is returned as
+        long as the file's mtime and size are unchanged, skipping the
+        read and re-validation. Callers that hand the parsed cases out
+        for mutation (or diff against them) must not use it.
+        """
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
         if not self.data_file.exists():
             empty_model = CaseFileModel(schema_version=APP_SCHEMA_VERSION)
             self._write_atomic(empty_model.to_serialisable())
 
+        if prefer_cache and not create_backup and self.current_model is not None:
+            try:
+                stat = self.data_file.stat()
+            except OSError:  # pragma: no cover - racing deletion
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == self._cached_stat:
+                return self.current_model
+
         try:
-            with self.lock.acquire(timeout=self.lock_timeout):
-                raw_text = self.data_file.read_text(encoding="utf-8")
-                if create_backup:
-                    self._create_backup(raw_text)
+            with self.lock.acquire(timeout=self.lock_timeout, poll_interval=LOCK_POLL_INTERVAL):
+                raw_bytes = self.data_file.read_bytes()
+                stat = self.data_file.stat()
         except Timeout as exc:  # pragma: no cover - depends on runtime contention
             raise DataLockError("Unable to acquire data lock") from exc
 
-        self.last_loaded_raw = raw_text
+        if create_backup:
+            # The bytes snapshot is immutable, so the backup does not need
+            # the lock; writing it asynchronously keeps the lock hold time
+            # and the caller's latency down to the read itself.
+            self._schedule_backup(raw_bytes)
+
+        self.last_loaded_raw = raw_bytes
+
+        # Cheap byte probe for the steady state: when the file is already on
+        # the current schema, validate straight from bytes and skip building
+        # the intermediate document dict. Any miss falls through to the full
+        # parse below, which also owns corruption and migration handling.
+        probe = _SCHEMA_VERSION_RE.search(raw_bytes, 0, 256)
+        if probe is not None and int(probe.group(1)) >= APP_SCHEMA_VERSION:
+            try:
+                model = CaseFileModel.model_validate_json(raw_bytes)
+            except PydanticValidationError:
+                pass
+            else:
+                self.current_model = model
+                self._cached_stat = (stat.st_mtime_ns, stat.st_size)
+                return model
 
         try:
-            document = json.loads(raw_text)
-        except json.JSONDecodeError as exc:
+            document = _json_loads(raw_bytes)
+        except (json.JSONDecodeError, ValueError) as exc:
             raise CorruptDataError("cases.json is corrupted", backups=self._list_backups()) from exc
 
         schema_version = int(document.get("schema_version", 1))
         migrated_model: CaseFileModel
 
         if schema_version < APP_SCHEMA_VERSION:
-            migrated_model = self._migrate(document, raw_text, schema_version)
+            migrated_model = self._migrate(document, raw_bytes.decode("utf-8"), schema_version)
             self.current_model = migrated_model
+            self._cached_stat = None
             return migrated_model
 
         try:
@@ -86,15 +186,40 @@ class CaseDataStore:
             raise ValidationError("Data file validation failed") from exc
 
         self.current_model = model
+        self._cached_stat = (stat.st_mtime_ns, stat.st_size)
         return model
 
-    def _create_backup(self, raw_text: str) -> None:
+    def _create_backup(self, raw_bytes: bytes) -> None:
         timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
         backup_path = BACKUP_DIR / f"cases-{timestamp}.json"
-        backup_path.write_text(raw_text, encoding="utf-8")
+        backup_path.write_bytes(raw_bytes)
+
+    def _schedule_backup(self, raw_bytes: bytes) -> None:
+        if self._backup_executor is None:
+            # One worker keeps backups ordered; threads are joined at
+            # interpreter exit so pending writes still land on shutdown.
+            self._backup_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="caseboard-backup"
+            )
+        self._backup_executor.submit(self._create_backup, raw_bytes)
 
     def _list_backups(self) -> List[str]:
-        return sorted(str(path) for path in BACKUP_DIR.glob("cases-*.json"))
+        # The directory mtime changes whenever a backup is added or removed,
+        # so it keys a cache that spares the scandir on repeated calls.
+        try:
+            mtime_ns = BACKUP_DIR.stat().st_mtime_ns
+        except OSError:
+            return []
+        if self._backups_cache is not None and self._backups_cache[0] == mtime_ns:
+            return self._backups_cache[1]
+        with os.scandir(BACKUP_DIR) as entries:
+            backups = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.startswith("cases-") and entry.name.endswith(".json")
+            )
+        self._backups_cache = (mtime_ns, backups)
+        return backups
 
     def _migrate(self, document: Dict[str, object], raw_text: str, from_version: int) -> CaseFileModel:
         """Perform schema migrations and persist diff output."""
@@ -106,14 +231,14 @@ class CaseDataStore:
                 # Ensure saved_at exists
                 if "saved_at" not in doc:
                     doc["saved_at"] = datetime.utcnow().isoformat() + "Z"
-                # Normalize case payloads
-                cases = []
-                for item in doc.get("cases", []):  # type: ignore[arg-type]
-                    try:
-                        cases.append(CasePayload.model_validate(item).model_dump())
-                    except PydanticValidationError as exc:
-                        raise MigrationError("Failed to normalise case payload", context={"case": item}) from exc
-                doc["cases"] = cases
+                # Normalize case payloads in one validation pass; the models
+                # go straight into CaseFileModel below without a re-dump.
+                try:
+                    doc["cases"] = _CASE_LIST_ADAPTER.validate_python(doc.get("cases", []))
+                except PydanticValidationError as exc:
+                    raise MigrationError(
+                        "Failed to normalise case payload", context={"errors": exc.errors()}
+                    ) from exc
         except Exception as exc:  # pragma: no cover - defensive
             raise MigrationError("Schema migration failed", context={"version": from_version}) from exc
 
@@ -124,9 +249,16 @@ class CaseDataStore:
         return migrated_model
 
     def _write_migration_diff(self, original: str, migrated: str) -> None:
+        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        if len(original) + len(migrated) > MIGRATION_DIFF_MAX_BYTES:
+            # difflib is quadratic in the worst case; for big files keep
+            # both sides verbatim for offline diffing instead.
+            (MIGRATIONS_DIR / f"cases-{timestamp}.old.json").write_text(original, encoding="utf-8")
+            (MIGRATIONS_DIR / f"cases-{timestamp}.new.json").write_text(migrated, encoding="utf-8")
+            return
+
         import difflib
 
-        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
         diff_path = MIGRATIONS_DIR / f"cases-{timestamp}.diff"
         diff = difflib.unified_diff(
             original.splitlines(keepends=True),
@@ -160,21 +292,48 @@ class CaseDataStore:
             cases=resolved_cases,
         )
 
-        payload = model.to_serialisable()
-
-        summary: Dict[str, object] = {}
-        audit_entries: List[str] = []
+        # Serialize and diff before taking the lock so the critical section
+        # is nothing but raw writes.
+        serialisable = model.to_serialisable()
+        payload_bytes = _json_dumps(serialisable)
+        # Everything but saved_at: keys whether this save actually changed
+        # the case data, not just the timestamp.
+        payload_key = hashlib.blake2b(
+            _json_dumps({k: v for k, v in serialisable.items() if k != "saved_at"}),
+            digest_size=16,
+        ).digest()
+        summary = self._build_summary(model)
+        summary_bytes = _json_dumps(summary)
+        # Everything but saved_at; if this matches the last write, the
+        # summary file's contents would be identical modulo the timestamp.
+        summary_key = hashlib.blake2b(
+            _json_dumps({k: v for k, v in summary.items() if k != "saved_at"}),
+            digest_size=16,
+        ).digest()
+        audit_entries = self._build_audit_entries(previous, model, actor=actor)
 
         try:
-            with self.lock.acquire(timeout=self.lock_timeout):
-                self._write_atomic(payload)
-                summary = self._write_summary(model)
-                audit_entries = self._append_audit(previous, model, actor=actor, action=action)
-                self._touch_bump()
+            with self.lock.acquire(timeout=self.lock_timeout, poll_interval=LOCK_POLL_INTERVAL):
+                self._write_atomic_bytes(payload_bytes)
+                if summary_key != self._last_summary_key:
+                    self._write_summary_bytes(summary_bytes)
+                    self._last_summary_key = summary_key
+                self._append_audit_lines(audit_entries)
+                if payload_key != self._last_payload_key:
+                    # Watchers poll .bump to decide when to reload; signal
+                    # on any payload change. Audit entries are the wrong
+                    # gate here: they ignore row ordering and only diff a
+                    # subset of fields, so e.g. a reorder-only save would
+                    # rewrite cases.json without ever bumping.
+                    self._touch_bump()
+                    self._last_payload_key = payload_key
         except Timeout as exc:  # pragma: no cover - depends on runtime contention
             raise DataLockError("Unable to acquire data lock for save") from exc
 
         self.current_model = model
+        # The saved model shares objects with the caller; force the next
+        # load to parse fresh so audit diffs see an independent snapshot.
+        self._cached_stat = None
 
         return SaveResult(
             saved_at=model.saved_at,
@@ -184,54 +343,54 @@ class CaseDataStore:
         )
 
     def _hydrate_identifiers(self, cases: Sequence[CasePayload], previous: CaseFileModel) -> List[CasePayload]:
-        by_case_no: Dict[str, CasePayload] = {case.case_number: case for case in previous.cases}
-        hydrated: List[CasePayload] = []
-        seen: set[str] = set()
+        if not previous.cases:
+            # Fresh store: nothing to reconcile ids against.
+            return list(cases)
 
+        by_case_no: Dict[str, str] = {case.case_number: case.id for case in previous.cases}
         for payload in cases:
-            case_number = payload.case_number
-            seen.add(case_number)
-            base = by_case_no.get(case_number)
-            if base and not payload.id:
-                payload.id = base.id
-            elif base and payload.id != base.id:
-                # Keep established stable id
-                payload.id = base.id
-            hydrated.append(payload)
-
-        # Preserve existing cases that were not part of new payload (should represent deletions)
-        return hydrated
+            base_id = by_case_no.get(payload.case_number)
+            # Keep established stable ids; this also fills in missing ones.
+            if base_id and payload.id != base_id:
+                payload.id = base_id
+
+        # Cases absent from the new payload represent deletions.
+        return list(cases)
 
     def _write_atomic(self, payload: Dict[str, object]) -> None:
+        self._write_atomic_bytes(_json_dumps(payload))
+
+    def _write_atomic_bytes(self, data: bytes) -> None:
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self.data_file.with_suffix(".tmp")
-        json_text = json.dumps(payload, indent=2)
-        tmp_path.write_text(json_text, encoding="utf-8")
+        tmp_path.write_bytes(data)
         os.replace(tmp_path, self.data_file)
 
-    def _write_summary(self, model: CaseFileModel) -> Dict[str, object]:
-        total = len(model.cases)
-        active = sum(1 for case in model.cases if case.status in {"open", "filed", "pre-filing"})
-        needs_attention = sum(1 for case in model.cases if case.attention == "needs_attention")
-
+    def _build_summary(self, model: CaseFileModel) -> Dict[str, object]:
+        active = 0
+        needs_attention = 0
         upcoming_deadlines: List[Tuple[str, str]] = []
         for case in model.cases:
+            if case.status in _ACTIVE_STATUSES:
+                active += 1
+            if case.attention == "needs_attention":
+                needs_attention += 1
             for deadline in case.deadlines:
-                if deadline.resolved:
-                    continue
-                upcoming_deadlines.append((case.case_number, deadline.due_date.isoformat()))
+                if not deadline.resolved:
+                    upcoming_deadlines.append((case.case_number, deadline.due_date.isoformat()))
 
-        upcoming_deadlines.sort(key=lambda item: item[1])
         summary_payload = {
-            "total": total,
+            "total": len(model.cases),
             "active": active,
             "needs_attention": needs_attention,
-            "upcoming": upcoming_deadlines[:5],
+            "upcoming": heapq.nsmallest(5, upcoming_deadlines, key=operator.itemgetter(1)),
             "saved_at": model.saved_at.isoformat() + "Z",
         }
+        return summary_payload
 
+    def _write_summary_bytes(self, summary_bytes: bytes) -> None:
         tmp_path = SUMMARY_FILE.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(summary_payload, indent=2), encoding="utf-8")
+        tmp_path.write_bytes(summary_bytes)
         try:
             os.replace(tmp_path, SUMMARY_FILE)
         except PermissionError:
@@ -239,28 +398,25 @@ class CaseDataStore:
                 SUMMARY_FILE.unlink(missing_ok=True)
                 os.replace(tmp_path, SUMMARY_FILE)
             except PermissionError:
-                SUMMARY_FILE.write_text(json.dumps(summary_payload, indent=2), encoding="utf-8")
+                SUMMARY_FILE.write_bytes(summary_bytes)
                 tmp_path.unlink(missing_ok=True)
-        return summary_payload
 
     def _touch_bump(self) -> None:
         BUMP_FILE.write_text(datetime.utcnow().isoformat() + "Z", encoding="utf-8")
 
-    def _append_audit(self, previous: CaseFileModel, current: CaseFileModel, *, actor: str, action: str) -> List[str]:
-        log_lines: List[str] = []
+    def _build_audit_entries(self, previous: CaseFileModel, current: CaseFileModel, *, actor: str) -> List[str]:
+        change_lines: List[str] = []
         timestamp = current.saved_at.isoformat() + "Z"
 
         previous_map = {case.case_number: case for case in previous.cases}
         current_map = {case.case_number: case for case in current.cases}
 
-        # Detect deletions
-        for case_no in sorted(previous_map.keys() - current_map.keys()):
-            log_lines.append(f"{timestamp} | {actor} | deleted | {case_no}")
-
-        # Detect additions and updates
+        # Detect additions and updates; popping matches as we go leaves
+        # exactly the deletions behind in previous_map.
         for case_no, case in current_map.items():
-            if case_no not in previous_map:
-                log_lines.append(f"{timestamp} | {actor} | created | {case_no}")
+            prior = previous_map.pop(case_no, None)
+            if prior is None:
+                change_lines.append(f"{timestamp} | {actor} | created | {case_no}")
                 # Log initial focus if present
                 if case.current_task and case.current_task.strip():
                     self.focus_log_manager.add_entry(
@@ -271,10 +427,10 @@ class CaseDataStore:
                     )
                 continue
 
-            diffs = self._diff_case(previous_map[case_no], case)
+            diffs = self._diff_case(prior, case)
             if diffs:
                 diff_text = "; ".join(f"{field}:{before}->{after}" for field, before, after in diffs)
-                log_lines.append(f"{timestamp} | {actor} | updated | {case_no} | {diff_text}")
+                change_lines.append(f"{timestamp} | {actor} | updated | {case_no} | {diff_text}")
                 
                 # Log focus changes to the focus history
                 for field, before, after in diffs:
@@ -288,36 +444,37 @@ class CaseDataStore:
                                 actor=actor
                             )
 
-        if not log_lines:
-            return []
-
-        AUDIT_LOG.parent.mkdir(parents=True, exist_ok=True)
-        with AUDIT_LOG.open("a", encoding="utf-8") as handle:
-            for line in log_lines:
-                handle.write(line + "\n")
-
+        # Anything left unmatched in previous_map was deleted; keep the
+        # deletions-first ordering of the log.
+        log_lines = [
+            f"{timestamp} | {actor} | deleted | {case_no}" for case_no in sorted(previous_map)
+        ]
+        log_lines.extend(change_lines)
         return log_lines
 
+    def _append_audit_lines(self, log_lines: List[str]) -> None:
+        if not log_lines:
+            return
+        if self._audit_fh is None or self._audit_fh.closed:
+            AUDIT_LOG.parent.mkdir(parents=True, exist_ok=True)
+            # Append-mode fd held for the store's lifetime; reopening the
+            # log on every autosave costs an open/close pair per save.
+            self._audit_fh = open(AUDIT_LOG, "ab", buffering=1 << 16)
+        self._audit_fh.write(b"".join(line.encode("utf-8") + b"\n" for line in log_lines))
+        # Flush while still holding the file lock so tail readers see the
+        # entries as soon as the save completes; durability rides on the OS
+        # page cache, same as the previous open/close-per-save behaviour.
+        self._audit_fh.flush()
+
     def _diff_case(self, previous: CasePayload, current: CasePayload) -> List[Tuple[str, str, str]]:
-        fields = [
-            "case_name",
-            "case_type",
-            "stage",
-            "attention",
-            "status",
-            "paralegal",
-            "current_task",
-            "next_due",
-            "county",
-            "division",
-            "judge",
-            "opposing_counsel",
-            "opposing_firm",
-        ]
+        # Fetch both field tuples in one C call; the tuple compare skips
+        # the per-field loop entirely for the unchanged-case majority.
+        old_values = _DIFF_GETTER(previous)
+        new_values = _DIFF_GETTER(current)
+        if old_values == new_values:
+            return []
         diffs: List[Tuple[str, str, str]] = []
-        for field_name in fields:
-            old_value = getattr(previous, field_name)
-            new_value = getattr(current, field_name)
+        for field_name, old_value, new_value in zip(_DIFF_FIELDS, old_values, new_values):
             if old_value != new_value:
                 diffs.append((field_name, self._format_diff_value(old_value), self._format_diff_value(new_value)))
         return diffs
@@ -330,6 +487,21 @@ class CaseDataStore:
             return value[:61] + "…"
         return str(value)
     
+    async def aload(self, *, create_backup: bool = True, prefer_cache: bool = False) -> CaseFileModel:
+        """Run load() in a worker thread so callers never block on the lock."""
+        return await asyncio.to_thread(self.load, create_backup=create_backup, prefer_cache=prefer_cache)
+
+    async def asave(
+        self,
+        cases: Sequence[CasePayload],
+        *,
+        actor: str = "system",
+        action: str = "autosave",
+        previous: Optional[CaseFileModel] = None,
+    ) -> SaveResult:
+        """Run save() in a worker thread so callers never block on the lock."""
+        return await asyncio.to_thread(self.save, cases, actor=actor, action=action, previous=previous)
+
     def get_focus_history(self, case_id: str, case_number: str, limit: Optional[int] = None):
         """Get focus history for a case.
         
@@ -346,13 +518,23 @@ class CaseDataStore:
         return self.focus_log_manager.get_all_entries(case_id, case_number)
 
 
+_DEFAULT_STORE: Optional[CaseDataStore] = None
+
+
+def _get_default_store() -> CaseDataStore:
+    """Return the shared module-level store, creating it on first use."""
+    global _DEFAULT_STORE
+    if _DEFAULT_STORE is None:
+        _DEFAULT_STORE = CaseDataStore()
+    return _DEFAULT_STORE
+
+
 def load_cases() -> List[CasePayload]:
-    store = CaseDataStore()
-    model = store.load()
+    model = _get_default_store().load()
     return list(model.cases)
 
 
 def save_cases(cases: Iterable[CasePayload]) -> SaveResult:
-    store = CaseDataStore()
+    store = _get_default_store()
     model = store.load(create_backup=False)
     return store.save(list(cases), previous=model)
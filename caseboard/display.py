@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+import copy
 import importlib
+import operator
 import threading
+import time
 
 from rich.markup import escape
 from rich.panel import Panel
@@ -25,6 +30,16 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - optional dependency guard
     yf = None
 
+try:
+    np = importlib.import_module("numpy")
+except ModuleNotFoundError:  # pragma: no cover - ships with yfinance/pandas
+    np = None
+
+try:
+    requests = importlib.import_module("requests")
+except ModuleNotFoundError:  # pragma: no cover - ships with yfinance
+    requests = None
+
 
 STOCK_TICKERS: List[str] = [
     "^DJI",
@@ -70,7 +85,18 @@ STOCK_TICKERS: List[str] = [
     "BA",
 ]
 
+OPEN_STATUSES = frozenset({"open", "filed", "pre-filing"})
+
+STATUS_TITLES = {
+    "open": "[green]ACTIVE[/]",
+    "filed": "[cyan]FILED[/]",
+    "pre-filing": "[yellow]PRE[/]",
+    "closed": "[blue]CLOSED[/]",
+}
+
 STOCK_REFRESH_SECONDS = 90
+# Yahoo rejects overly long quote URLs; retry in chunks of this size.
+STOCK_BATCH_SIZE = 20
 STOCK_SCROLL_SECONDS = 2.0
 STOCK_WINDOW = 7
 STOCK_SEPARATOR = "   |   "
@@ -160,7 +186,12 @@ Screen {
         self._stock_quotes: Dict[str, Tuple[float, float]] = {}
         self._stock_segments: List[Text] = []
         self._stock_offset: int = 0
-        self._stock_fetching: bool = False
+        self._stock_buffer: List[Text] = []
+        self._stock_separator = Text(STOCK_SEPARATOR, style="#3a5a87")
+        self._stock_header = Text("MARKET • ", style="bold #33aaff")
+        self._stock_fetching = threading.Event()
+        self._stock_executor: Optional[ThreadPoolExecutor] = None
+        self._yf_session = None
         self._focus_animation_active: bool = False
         self._focus_animation_step: int = 0
         self._focus_animation_total: int = 0
@@ -168,6 +199,18 @@ Screen {
         self._focus_animation_override: Dict[str, str] | None = None
         self._focus_animation_case_id: str | None = None
         self._focus_animation_pointer: int = -1
+        self._focus_animation_prev_frame: Tuple[object, bool] | None = None
+        self._display_visible: bool = True
+        # strftime is costly at animation frame rates; format the time
+        # once per wall-clock second and the date part once per day.
+        self._time_cache: Tuple[int, str] = (-1, "")
+        self._clock_date_cache: Tuple[int, str] = (-1, "")
+        # case.id -> rendered 9-cell markup tuple, reused across animation
+        # frames so only the animated row is rebuilt per tick.
+        self._row_markup_cache: Dict[str, Tuple[str, ...]] = {}
+        # case.id -> (next unresolved deadline, days until due), built per refresh
+        self._deadline_cache: Dict[str, Tuple[object, int]] = {}
+        self._table_template: Optional[Table] = None
 
     def compose(self) -> ComposeResult:
         self.clock = Static(id="display-clock")
@@ -204,9 +247,29 @@ Screen {
     def action_refresh(self) -> None:
         self.refresh_display()
 
+    def on_app_focus(self) -> None:
+        self._display_visible = True
+
+    def on_app_blur(self) -> None:
+        # Stop burning CPU on animation frames nobody is watching.
+        self._display_visible = False
+
     def refresh_display(self) -> None:
         self.cases = load_cases()
-        self.cases.sort(key=self._case_sort_key)
+        # Resolve each case's next deadline once; the sort key and all
+        # three render passes read from this cache.
+        today = date.today()
+        self._deadline_cache = {}
+        for case in self.cases:
+            next_deadline = case.next_deadline(today)
+            days = (next_deadline.due_date - today).days if next_deadline else 9999
+            self._deadline_cache[case.id] = (next_deadline, days)
+        # Decorate-sort-undecorate: compute each key once and let sort
+        # compare plain tuples instead of calling back into Python.
+        decorated = [(self._case_sort_key(case), case) for case in self.cases]
+        decorated.sort(key=operator.itemgetter(0))
+        self.cases = [case for _, case in decorated]
+        self._row_markup_cache.clear()
         self._render_summary()
         self._render_deadlines()
         self._render_case_table()
@@ -215,29 +278,33 @@ Screen {
         if not self.clock:
             return
         now = datetime.now()
-        self.clock.update(now.strftime("%A • %B %d, %Y • %I:%M:%S %p"))
+        if now.day != self._clock_date_cache[0]:
+            self._clock_date_cache = (now.day, now.strftime("%A • %B %d, %Y • "))
+        self.clock.update(self._clock_date_cache[1] + self._current_time_text())
+
+    def _current_time_text(self) -> str:
+        epoch = int(time.time())
+        if epoch != self._time_cache[0]:
+            self._time_cache = (epoch, datetime.now().strftime("%I:%M:%S %p"))
+        return self._time_cache[1]
 
     def _case_sort_key(self, case: Case):
         attention_priority = 0 if case.attention == "needs_attention" else 1
-        status_priority = 0 if case.status in {"open", "filed", "pre-filing"} else 1
-        next_deadline = case.next_deadline(date.today())
-        if next_deadline:
-            deadline_priority = (next_deadline.due_date - date.today()).days
-        else:
-            deadline_priority = 9999
+        status_priority = 0 if case.status in OPEN_STATUSES else 1
+        deadline_priority = self._deadline_cache[case.id][1]
         return (attention_priority, deadline_priority, status_priority, case.case_name.lower())
 
     def _render_summary(self) -> None:
         if not self.summary_panel:
             return
         total_cases = len(self.cases)
-        attention_cases = len([c for c in self.cases if c.attention == "needs_attention"])
-        open_cases = len([c for c in self.cases if c.status in {"open", "filed", "pre-filing"}])
-
-        by_type: dict[str, int] = {}
+        attention_cases = 0
+        open_cases = 0
+        by_type: Counter[str] = Counter()
         for case in self.cases:
-            normalized_type = normalize_case_type(case.case_type) if case.case_type else "Other"
-            by_type[normalized_type] = by_type.get(normalized_type, 0) + 1
+            attention_cases += case.attention == "needs_attention"
+            open_cases += case.status in OPEN_STATUSES
+            by_type[normalize_case_type(case.case_type) if case.case_type else "Other"] += 1
 
         table = Table.grid(expand=True, pad_edge=False)
         table.add_row(Text("TOTAL CASES", style="bold #b5e0ff"), Text(str(total_cases), style="bold white"))
@@ -245,7 +312,7 @@ Screen {
         table.add_row(Text("NEEDS ATTENTION", style="#ff9b9b"), Text(str(attention_cases), style="white"))
 
         # Top three practice areas
-        top_types = sorted(by_type.items(), key=lambda item: item[1], reverse=True)[:3]
+        top_types = by_type.most_common(3)
         if top_types:
             table.add_row(Text("TOP PRACTICE AREAS", style="bold #9bd3ff"), Text("", style="white"))
             for practice, count in top_types:
@@ -256,12 +323,10 @@ Screen {
     def _render_deadlines(self) -> None:
         if not self.deadline_panel:
             return
-        today = date.today()
         upcoming: list[tuple[Case, int, str]] = []
         for case in self.cases:
-            next_deadline = case.next_deadline(today)
+            next_deadline, days = self._deadline_cache.get(case.id, (None, 9999))
             if next_deadline:
-                days = (next_deadline.due_date - today).days
                 upcoming.append((case, days, f"{next_deadline.due_date.strftime('%m/%d/%y')} • {next_deadline.description}"))
         upcoming.sort(key=lambda item: item[1])
 
@@ -289,64 +354,29 @@ Screen {
             self.case_table.update(Panel("No cases on file", border_style="#0d3a66"))
             return
 
-        table = Table(
-            box=box.SIMPLE_HEAD,
-            expand=True,
-            pad_edge=False,
-            show_edge=False,
-            show_header=True,
-            style="#e7f1ff",
-            header_style="bold #9bd3ff",
-            row_styles=["on #081735", "on #0b2144"],
-            border_style="#184b78",
-        )
-        table.add_column("CASE #", style="bold #c6e5ff", no_wrap=True)
-        table.add_column("CASE NAME", style="#f0f8ff", ratio=2, overflow="ellipsis")
-        table.add_column("TYPE", style="#8fd4ff", width=16, no_wrap=True)
-        table.add_column("STAGE", style="#a8bee2", width=12, overflow="ellipsis")
-        table.add_column("ATTN", style="#ff8787", width=10, no_wrap=True)
-        table.add_column("STATUS", style="#a4ffd6", width=10, no_wrap=True)
-        table.add_column("PARALEGAL", style="#b8ccef", width=16, overflow="ellipsis")
-        table.add_column("FOCUS", style="#f5fbff", ratio=2, overflow="ellipsis")
-        table.add_column("NEXT DUE", style="#ffd88a", width=28, no_wrap=True, overflow="ellipsis")
-
-        today = date.today()
-        for idx, case in enumerate(self.cases):
-            raw_type = case.case_type if case.case_type else "Other"
-            normalized_type = normalize_case_type(raw_type)
-            type_color = case_type_color(raw_type)
-            type_name = escape(normalized_type)
-            type_label = f"[{type_color}]{type_name}[/]"
+        table = self._new_case_table()
 
-            stage_label = escape(case.stage or "-")
-
-            if case.attention == "needs_attention":
-                attention_label = "[blink bold #ff6666]⚠ ALERT[/]"
-            else:
-                attention_label = "[dim]WAIT[/]"
-
-            status_titles = {
-                "open": "[green]ACTIVE[/]",
-                "filed": "[cyan]FILED[/]",
-                "pre-filing": "[yellow]PRE[/]",
-                "closed": "[blue]CLOSED[/]",
-            }
-            status_label = status_titles.get(case.status, f"[white]{escape(case.status.upper())}[/]")
-
-            focus = self._focus_text_for_case(case)
-            if focus == "-":
-                default_focus_display = "[dim]-[/]"
-            else:
-                default_focus_display = f"[white]{escape(focus)}[/]"
-
-            if self._focus_animation_override and case.id in self._focus_animation_override:
-                anim_text = self._focus_animation_override[case.id]
+        cache = self._row_markup_cache
+        override = self._focus_animation_override
+        for case in self.cases:
+            if override and case.id in override:
+                # Animated rows bypass the cache: only their focus cell
+                # differs from the cached rendering.
+                base = cache.get(case.id)
+                if base is None:
+                    base = self._build_row_cells(case)
+                    cache[case.id] = base
+                cells = list(base)
+                anim_text = override[case.id]
                 if anim_text:
-                    focus_display = f"[white]{escape(anim_text)}[/]"
+                    cells[7] = f"[white]{escape(anim_text)}[/]"
                 else:
-                    focus_display = "[dim]  [/]"
+                    cells[7] = "[dim]  [/]"
             else:
-                focus_display = default_focus_display
+                cells = cache.get(case.id)
+                if cells is None:
+                    cells = self._build_row_cells(case)
+                    cache[case.id] = cells
 
             row_style: str | None = None
             if self._focus_animation_case_id == case.id:
@@ -355,35 +385,10 @@ Screen {
                 else:
                     row_style = "on #152b4a"
 
-            next_deadline = case.next_deadline(today)
-            if next_deadline:
-                days = (next_deadline.due_date - today).days
-                color = deadline_color(days)
-                desc = next_deadline.description or "-"
-                if len(desc) > 30:
-                    desc = desc[:29] + "…"
-                due_text = (
-                    f"[{color}]{next_deadline.due_date.strftime('%m/%d/%y')} ({days:+d})[/]"
-                    f" [#a0b8d6]{escape(desc)}[/]"
-                )
-            else:
-                due_text = "[dim]—[/]"
-
-            table.add_row(
-                escape(case.case_number or "-"),
-                escape(case.case_name or "-"),
-                type_label,
-                stage_label,
-                attention_label,
-                status_label,
-                escape(case.paralegal or "-"),
-                focus_display,
-                due_text,
-                style=row_style,
-            )
+            table.add_row(*cells, style=row_style)
 
         footer = Text.from_markup(
-            "[dim]Updated[/] [white]" + datetime.now().strftime("%I:%M:%S %p") + "[/]"
+            "[dim]Updated[/] [white]" + self._current_time_text() + "[/]"
         )
         self.case_table.update(
             Panel(
@@ -395,8 +400,89 @@ Screen {
             )
         )
 
+    def _new_case_table(self) -> Table:
+        """Clone the column skeleton instead of redeclaring it every render."""
+        if self._table_template is None:
+            template = Table(
+                box=box.SIMPLE_HEAD,
+                expand=True,
+                pad_edge=False,
+                show_edge=False,
+                show_header=True,
+                style="#e7f1ff",
+                header_style="bold #9bd3ff",
+                row_styles=["on #081735", "on #0b2144"],
+                border_style="#184b78",
+            )
+            template.add_column("CASE #", style="bold #c6e5ff", no_wrap=True)
+            template.add_column("CASE NAME", style="#f0f8ff", ratio=2, overflow="ellipsis")
+            template.add_column("TYPE", style="#8fd4ff", width=16, no_wrap=True)
+            template.add_column("STAGE", style="#a8bee2", width=12, overflow="ellipsis")
+            template.add_column("ATTN", style="#ff8787", width=10, no_wrap=True)
+            template.add_column("STATUS", style="#a4ffd6", width=10, no_wrap=True)
+            template.add_column("PARALEGAL", style="#b8ccef", width=16, overflow="ellipsis")
+            template.add_column("FOCUS", style="#f5fbff", ratio=2, overflow="ellipsis")
+            template.add_column("NEXT DUE", style="#ffd88a", width=28, no_wrap=True, overflow="ellipsis")
+            self._table_template = template
+
+        table = copy.copy(self._table_template)
+        table.rows = []
+        columns = []
+        for column in self._table_template.columns:
+            column = copy.copy(column)
+            column._cells = []
+            columns.append(column)
+        table.columns = columns
+        return table
+
+    def _build_row_cells(self, case: Case) -> Tuple[str, ...]:
+        raw_type = case.case_type if case.case_type else "Other"
+        normalized_type = normalize_case_type(raw_type)
+        type_color = case_type_color(raw_type)
+        type_label = f"[{type_color}]{escape(normalized_type)}[/]"
+
+        stage_label = escape(case.stage or "-")
+
+        if case.attention == "needs_attention":
+            attention_label = "[blink bold #ff6666]⚠ ALERT[/]"
+        else:
+            attention_label = "[dim]WAIT[/]"
+
+        status_label = STATUS_TITLES.get(case.status) or f"[white]{escape(case.status.upper())}[/]"
+
+        focus = self._focus_text_for_case(case)
+        if focus == "-":
+            focus_display = "[dim]-[/]"
+        else:
+            focus_display = f"[white]{escape(focus)}[/]"
+
+        next_deadline, days = self._deadline_cache.get(case.id, (None, 9999))
+        if next_deadline:
+            color = deadline_color(days)
+            desc = next_deadline.description or "-"
+            if len(desc) > 30:
+                desc = desc[:29] + "…"
+            due_text = (
+                f"[{color}]{next_deadline.due_date.strftime('%m/%d/%y')} ({days:+d})[/]"
+                f" [#a0b8d6]{escape(desc)}[/]"
+            )
+        else:
+            due_text = "[dim]—[/]"
+
+        return (
+            escape(case.case_number or "-"),
+            escape(case.case_name or "-"),
+            type_label,
+            stage_label,
+            attention_label,
+            status_label,
+            escape(case.paralegal or "-"),
+            focus_display,
+            due_text,
+        )
+
     def _trigger_focus_animation(self) -> None:
-        if self._focus_animation_active or not self.cases:
+        if self._focus_animation_active or not self.cases or not self._display_visible:
             return
 
         focus_cases = [case for case in self.cases if self._focus_text_for_case(case) not in {"-", ""}]
@@ -412,10 +498,11 @@ Screen {
         self._focus_animation_total = len(focus_text)
         self._focus_animation_source = {target_case.id: focus_text}
         self._focus_animation_case_id = target_case.id
+        self._focus_animation_prev_frame = None
         self._apply_focus_animation_step()
 
     def _advance_focus_animation(self) -> None:
-        if not self._focus_animation_active:
+        if not self._focus_animation_active or not self._display_visible:
             return
 
         self._focus_animation_step += 1
@@ -446,6 +533,14 @@ Screen {
             else:
                 overrides[case_id] = full_text[:typing_step]
 
+        # Leading/trailing pad frames repeat the same visible text; only
+        # re-render when the frame actually differs.
+        frame = (tuple(sorted(overrides.items())), self._focus_animation_step <= 2)
+        if frame == self._focus_animation_prev_frame:
+            self._focus_animation_override = overrides
+            return
+        self._focus_animation_prev_frame = frame
+
         self._focus_animation_override = overrides
         self._render_case_table()
 
@@ -473,27 +568,53 @@ Screen {
         self._refresh_stock_quotes()
 
     def _refresh_stock_quotes(self) -> None:
-        if yf is None or self._stock_fetching:
+        if yf is None or self._stock_fetching.is_set():
             return
 
-        self._stock_fetching = True
+        self._stock_fetching.set()
+        if self._stock_executor is None:
+            self._stock_executor = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="stock-fetch"
+            )
+        executor = self._stock_executor
 
         def worker() -> None:
-            quotes = self._fetch_stock_quotes()
-            self.call_from_thread(self._apply_stock_quotes, quotes)
-
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
-
-    def _apply_stock_quotes(self, quotes: Dict[str, Tuple[float, float]]) -> None:
-        self._stock_fetching = False
-        self._stock_quotes = quotes
-        self._stock_segments = self._build_stock_segments(quotes)
-        self._stock_offset = 0
+            chunks = [
+                STOCK_TICKERS[start : start + STOCK_BATCH_SIZE]
+                for start in range(0, len(STOCK_TICKERS), STOCK_BATCH_SIZE)
+            ]
+            futures = {
+                executor.submit(self._download_quote_frame, chunk): chunk
+                for chunk in chunks
+            }
+            try:
+                # Stream each chunk into the UI as it lands instead of
+                # waiting for the slowest request.
+                for future in as_completed(futures):
+                    try:
+                        frame = future.result()
+                    except Exception:
+                        continue
+                    if frame is None or frame.empty:
+                        continue
+                    partial = self._quotes_from_frame(frame, futures[future])
+                    if partial:
+                        self.call_from_thread(self._merge_stock_partial, partial)
+            finally:
+                self._stock_fetching.clear()
+                self.call_from_thread(self._update_stock_ticker)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _merge_stock_partial(self, partial: Dict[str, Tuple[float, float]]) -> None:
+        self._stock_quotes.update(partial)
+        self._stock_segments = self._build_stock_segments(self._stock_quotes)
+        # Wrap-extend so every window is a plain slice, no modulo indexing.
+        self._stock_buffer = self._stock_segments + self._stock_segments[:STOCK_WINDOW]
         self._update_stock_ticker()
 
     def _advance_stock_ticker(self) -> None:
-        if yf is None or not self._stock_segments:
+        if yf is None or not self._stock_segments or not self._display_visible:
             return
         self._stock_offset = (self._stock_offset + 1) % len(self._stock_segments)
         self._update_stock_ticker()
@@ -505,22 +626,15 @@ Screen {
             return
 
         if not self._stock_segments:
-            message = "Fetching market data…" if self._stock_fetching else "Market data unavailable."
+            message = "Fetching market data…" if self._stock_fetching.is_set() else "Market data unavailable."
             self.stock_ticker.update(Text(message, style="dim"))
             return
 
         window = min(STOCK_WINDOW, len(self._stock_segments))
-        pieces: List[Text] = []
-        for i in range(window):
-            idx = (self._stock_offset + i) % len(self._stock_segments)
-            pieces.append(self._stock_segments[idx])
-            if i < window - 1:
-                pieces.append(Text(STOCK_SEPARATOR, style="#3a5a87"))
-
-        line = Text().join(pieces)
-        header = Text("MARKET • ", style="bold #33aaff")
-        timestamp = Text(datetime.now().strftime("  %I:%M:%S %p"), style="dim #88aadd")
-        self.stock_ticker.update(header + line + timestamp)
+        visible = self._stock_buffer[self._stock_offset : self._stock_offset + window]
+        line = self._stock_separator.join(visible)
+        timestamp = Text("  " + self._current_time_text(), style="dim #88aadd")
+        self.stock_ticker.update(self._stock_header + line + timestamp)
 
     def _build_stock_segments(self, quotes: Dict[str, Tuple[float, float]]) -> List[Text]:
         segments: List[Text] = []
@@ -544,46 +658,73 @@ Screen {
             segment.append(f"{arrow}{change_pct:+5.2f}%", style=color)
         return segment
 
-    def _fetch_stock_quotes(self) -> Dict[str, Tuple[float, float]]:
-        quotes: Dict[str, Tuple[float, float]] = {}
-        if yf is None:
-            return quotes
-
-        try:
-            tickers = yf.Tickers(" ".join(STOCK_TICKERS))
-        except Exception:
-            return quotes
-
-        for symbol in STOCK_TICKERS:
-            ticker = tickers.tickers.get(symbol)
-            if ticker is None:
-                continue
-
-            price: float | None = None
-            change_pct: float | None = None
+    def _get_yf_session(self):
+        """Lazily build one keep-alive session shared by all quote requests."""
+        if requests is None:
+            return None
+        if self._yf_session is None:
+            from requests.adapters import HTTPAdapter, Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=20,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._yf_session = session
+        return self._yf_session
+
+    def _download_quote_frame(self, symbols: List[str]):
+        return yf.download(
+            list(symbols),
+            period="2d",
+            interval="1d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            auto_adjust=False,
+            session=self._get_yf_session(),
+        )
 
+    def _quotes_from_frame(self, frame, symbols: List[str]) -> Dict[str, Tuple[float, float]]:
+        quotes: Dict[str, Tuple[float, float]] = {}
+        if np is not None:
+            # Compute every symbol's change in one vectorized pass; NaNs
+            # from missing data simply fail the isfinite filter.
             try:
-                fast = ticker.fast_info
-                price = getattr(fast, "last_price", None)
-                change_pct = getattr(fast, "regular_market_change_percent", None)
-                if (change_pct is None or change_pct == 0) and price is not None:
-                    prev_close = getattr(fast, "previous_close", None)
-                    if prev_close:
-                        change_pct = ((price - prev_close) / prev_close) * 100
+                if len(symbols) == 1:
+                    closes = frame[["Close"]]
+                    closes.columns = [symbols[0]]
+                else:
+                    closes = frame.xs("Close", level=1, axis=1)
+                values = closes.to_numpy(dtype=float)
+                if values.shape[0] < 2:
+                    return quotes
+                prev, last = values[-2], values[-1]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    pct = (last - prev) / prev * 100.0
+                for index, symbol in enumerate(closes.columns):
+                    if np.isfinite(last[index]) and np.isfinite(pct[index]):
+                        quotes[symbol] = (float(last[index]), float(pct[index]))
+                return quotes
             except Exception:
-                pass
-
-            if (price is None or change_pct is None) and hasattr(ticker, "info"):
-                try:
-                    info = ticker.info
-                    price = info.get("regularMarketPrice", price)
-                    change_pct = info.get("regularMarketChangePercent", change_pct)
-                except Exception:
-                    pass
-
-            if isinstance(price, (int, float)) and isinstance(change_pct, (int, float)):
-                quotes[symbol] = (float(price), float(change_pct))
+                quotes.clear()
 
+        single = len(symbols) == 1
+        for symbol in symbols:
+            try:
+                closes = (frame if single else frame[symbol])["Close"].dropna()
+                if len(closes) < 2:
+                    continue
+                last = float(closes.iloc[-1])
+                prev = float(closes.iloc[-2])
+                if not prev:
+                    continue
+                quotes[symbol] = (last, (last - prev) / prev * 100.0)
+            except Exception:
+                continue
         return quotes
 
 
@@ -4,9 +4,21 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic.fields import Field
+from pydantic.main import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _json_loads(raw: str) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class FocusEntry(BaseModel):
@@ -46,33 +58,91 @@ class FocusLogManager:
             log_dir = Path("data") / "focus_logs"
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
-    
+        # Parsed logs cached per case, keyed on the file's (mtime_ns, size)
+        # so readers in other processes (the web dashboard) pick up appends
+        # made elsewhere instead of serving the first parse forever.
+        self._log_cache: Dict[str, Tuple[Optional[Tuple[int, int]], FocusLog]] = {}
+
     def _get_log_path(self, case_id: str) -> Path:
-        """Get the path to a case's focus log file."""
+        """Get the path to a case's focus log file (JSON Lines, one entry per line)."""
+        return self.log_dir / f"{case_id}.jsonl"
+
+    def _legacy_log_path(self, case_id: str) -> Path:
+        """Path of the pre-JSONL single-document log, kept readable for migration."""
         return self.log_dir / f"{case_id}.json"
-    
+
+    def _stat_key(self, case_id: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the case's log file, or None when absent."""
+        try:
+            stat = self._get_log_path(case_id).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def load_log(self, case_id: str, case_number: str) -> FocusLog:
         """Load the focus log for a case.
-        
+
         Args:
             case_id: The case ID
             case_number: The case number (for creating new logs)
-            
+
         Returns:
             The focus log for the case
         """
+        stat_key = self._stat_key(case_id)
+        cached = self._log_cache.get(case_id)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        log = self._read_log(case_id, case_number)
+        self._log_cache[case_id] = (stat_key, log)
+        return log
+
+    def _read_log(self, case_id: str, case_number: str) -> FocusLog:
         log_path = self._get_log_path(case_id)
-        if not log_path.exists():
+        if log_path.exists():
+            entries: List[FocusEntry] = []
+            try:
+                with log_path.open("r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = _json_loads(line)
+                            try:
+                                # Lines we wrote ourselves: skip pydantic
+                                # validation and parse the timestamp directly.
+                                entries.append(
+                                    FocusEntry.model_construct(
+                                        timestamp=datetime.fromisoformat(
+                                            record["timestamp"].rstrip("Z")
+                                        ),
+                                        focus_text=record["focus_text"],
+                                        actor=record.get("actor", "user"),
+                                    )
+                                )
+                            except (KeyError, TypeError, ValueError, AttributeError):
+                                entries.append(FocusEntry.model_validate(record))
+                        except Exception:
+                            # Skip malformed lines rather than losing the log
+                            continue
+            except OSError:
+                entries = []
+            return FocusLog(case_id=case_id, case_number=case_number, entries=entries)
+
+        legacy_path = self._legacy_log_path(case_id)
+        if not legacy_path.exists():
             return FocusLog(case_id=case_id, case_number=case_number, entries=[])
-        
+
         try:
-            with log_path.open("r", encoding="utf-8") as f:
+            with legacy_path.open("r", encoding="utf-8") as f:
                 data = json.load(f)
             return FocusLog.model_validate(data)
         except (json.JSONDecodeError, Exception):
             # If corrupted, start fresh
             return FocusLog(case_id=case_id, case_number=case_number, entries=[])
-    
+
     def add_entry(
         self, 
         case_id: str, 
@@ -105,36 +175,43 @@ class FocusLogManager:
             actor=actor
         )
         log.entries.append(entry)
-        
-        self._save_log(log)
-    
+
+        log_path = self._get_log_path(case_id)
+        if not log_path.exists() and len(log.entries) > 1:
+            # First append for a case whose history came from a legacy
+            # .json log: materialise the merged entries in the new file
+            # before switching formats, otherwise later reads see only
+            # the appended line and the old history silently vanishes.
+            self._save_log(log)
+            return
+
+        # Append one line; the full document is never rewritten per entry.
+        with log_path.open("a", encoding="utf-8") as f:
+            f.write(self._entry_line(entry))
+        # Re-key the cache on the file we just grew so the writer's own
+        # next read stays a cache hit.
+        self._log_cache[case_id] = (self._stat_key(case_id), log)
+
+    @staticmethod
+    def _entry_line(entry: FocusEntry) -> str:
+        timestamp = (
+            entry.timestamp.isoformat() + "Z"
+            if entry.timestamp.tzinfo is None
+            else entry.timestamp.replace(tzinfo=None).isoformat() + "Z"
+        )
+        return json.dumps(
+            {"timestamp": timestamp, "focus_text": entry.focus_text, "actor": entry.actor}
+        ) + "\n"
+
     def _save_log(self, log: FocusLog) -> None:
-        """Save a focus log to disk."""
+        """Rewrite a full log atomically (compaction/migration only)."""
         log_path = self._get_log_path(log.case_id)
-        
-        # Convert to dict for JSON serialization
-        data = {
-            "case_id": log.case_id,
-            "case_number": log.case_number,
-            "entries": [
-                {
-                    "timestamp": (
-                        entry.timestamp.isoformat() + "Z"
-                        if entry.timestamp.tzinfo is None
-                        else entry.timestamp.replace(tzinfo=None).isoformat() + "Z"
-                    ),
-                    "focus_text": entry.focus_text,
-                    "actor": entry.actor
-                }
-                for entry in log.entries
-            ]
-        }
-        
-        # Write atomically
+
         tmp_path = log_path.with_suffix(".tmp")
         with tmp_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            f.writelines(self._entry_line(entry) for entry in log.entries)
         tmp_path.replace(log_path)
+        self._log_cache[log.case_id] = (self._stat_key(log.case_id), log)
     
     def get_recent_entries(
         self, 
@@ -1,36 +1,122 @@
 from __future__ import annotations
 
-from typing import List, Sequence
+from collections import deque
+from typing import Any, Deque, List, Sequence, Tuple
 
 from .schema import CasePayload
 
+MAX_UNDO_STACK_SIZE = 500
+
+# Each entry is an op tuple describing a single mutation:
+#   ("edit", case_index, field, old_value, new_value)
+#   ("add", case_index, case)
+#   ("delete", case_index, case)
+#   ("move", source_index, target_index)
+#   ("bulk", before_cases)  /  ("bulk", after_cases) once exchanged
+Delta = Tuple[Any, ...]
+
 
 class HistoryManager:
-    """Maintain undo/redo stacks for case mutations."""
+    """Maintain undo/redo stacks of per-mutation deltas.
 
-    def __init__(self, max_size: int = 50) -> None:
+    Single-field edits, adds, deletes and moves record only the affected
+    row, so pushing history costs O(1) instead of deep-copying the whole
+    case list. Bulk operations (import, dedupe) snapshot the prior list,
+    but only shallowly — see push_bulk.
+    """
+
+    def __init__(self, max_size: int = MAX_UNDO_STACK_SIZE) -> None:
         self.max_size = max_size
-        self._undo: List[List[CasePayload]] = []
-        self._redo: List[List[CasePayload]] = []
+        # maxlen discards the oldest entry in O(1); a plain list would
+        # shift every element on each trim.
+        self._undo: Deque[Delta] = deque(maxlen=max_size)
+        self._redo: Deque[Delta] = deque(maxlen=max_size)
 
-    def snapshot(self, cases: Sequence[CasePayload]) -> None:
-        snapshot = [case.model_copy(deep=True) for case in cases]
-        self._undo.append(snapshot)
-        if len(self._undo) > self.max_size:
-            self._undo.pop(0)
+    def _push(self, delta: Delta) -> None:
+        self._undo.append(delta)
         self._redo.clear()
 
-    def undo(self, current: Sequence[CasePayload]) -> List[CasePayload] | None:
+    def push_edit(self, case_index: int, field: str, old_value: Any, new_value: Any) -> None:
+        self._push(("edit", case_index, field, old_value, new_value))
+
+    def push_add(self, case_index: int, case: CasePayload) -> None:
+        self._push(("add", case_index, case))
+
+    def push_delete(self, case_index: int, case: CasePayload) -> None:
+        self._push(("delete", case_index, case))
+
+    def push_move(self, source_index: int, target_index: int) -> None:
+        self._push(("move", source_index, target_index))
+
+    def push_bulk(self, before: Sequence[CasePayload]) -> None:
+        # A shallow copy is enough: every later mutation of a shared case is
+        # itself recorded as a delta and undone first (LIFO), so by the time
+        # this snapshot is restored the objects hold their snapshot-time
+        # values again.
+        self._push(("bulk", list(before)))
+
+    # Backwards-compatible alias for callers that only have the prior list.
+    def snapshot(self, cases: Sequence[CasePayload]) -> None:
+        self.push_bulk(cases)
+
+    def discard_last(self) -> None:
+        """Drop the most recent undo entry (e.g. after an aborted bulk op)."""
+        if self._undo:
+            self._undo.pop()
+
+    def undo(self, cases: List[CasePayload]) -> bool:
         if not self._undo:
-            return None
-        self._redo.append([case.model_copy(deep=True) for case in current])
-        return self._undo.pop()
+            return False
+        delta = self._undo.pop()
+        self._redo.append(self._apply_inverse(delta, cases))
+        return True
 
-    def redo(self, current: Sequence[CasePayload]) -> List[CasePayload] | None:
+    def redo(self, cases: List[CasePayload]) -> bool:
         if not self._redo:
-            return None
-        self._undo.append([case.model_copy(deep=True) for case in current])
-        return self._redo.pop()
+            return False
+        delta = self._redo.pop()
+        self._undo.append(self._apply_forward(delta, cases))
+        return True
+
+    def _apply_inverse(self, delta: Delta, cases: List[CasePayload]) -> Delta:
+        op = delta[0]
+        if op == "edit":
+            _, case_index, field, old_value, _new_value = delta
+            setattr(cases[case_index], field, old_value)
+        elif op == "add":
+            _, case_index, _case = delta
+            del cases[case_index]
+        elif op == "delete":
+            _, case_index, case = delta
+            cases.insert(case_index, case)
+        elif op == "move":
+            _, source_index, target_index = delta
+            cases.insert(source_index, cases.pop(target_index))
+        elif op == "bulk":
+            current = list(cases)
+            cases[:] = delta[1]
+            return ("bulk", current)
+        return delta
+
+    def _apply_forward(self, delta: Delta, cases: List[CasePayload]) -> Delta:
+        op = delta[0]
+        if op == "edit":
+            _, case_index, field, _old_value, new_value = delta
+            setattr(cases[case_index], field, new_value)
+        elif op == "add":
+            _, case_index, case = delta
+            cases.insert(case_index, case)
+        elif op == "delete":
+            _, case_index, _case = delta
+            del cases[case_index]
+        elif op == "move":
+            _, source_index, target_index = delta
+            cases.insert(target_index, cases.pop(source_index))
+        elif op == "bulk":
+            current = list(cases)
+            cases[:] = delta[1]
+            return ("bulk", current)
+        return delta
 
     def clear(self) -> None:
         self._undo.clear()
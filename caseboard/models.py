@@ -1,6 +1,8 @@
 from __future__ import annotations
+from bisect import insort
 from dataclasses import dataclass, field, asdict
-from datetime import date, datetime
+from datetime import date
+from operator import attrgetter
 from typing import List, Optional, Dict, Any
 import uuid
 
@@ -8,20 +10,65 @@ from .constants import normalize_case_type
 
 DATE_FMT = "%Y-%m-%d"
 
+_DUE_DATE_KEY = attrgetter("due_date")
+
+# Plain string fields emitted by Case.to_dict; fetched in one attrgetter
+# call instead of fourteen attribute reads.
+_CASE_PLAIN_KEYS = (
+    "id",
+    "case_number",
+    "county",
+    "division",
+    "judge",
+    "case_name",
+    "stage",
+    "case_type",
+    "opposing_counsel",
+    "opposing_firm",
+    "paralegal",
+    "current_task",
+    "attention",
+    "status",
+)
+_CASE_FIELD_GETTER = attrgetter(*_CASE_PLAIN_KEYS)
+
+# Defaults applied in Case.from_dict via one C-level dict merge instead
+# of a .get() call per field. Also the allow-list of plain fields: keys
+# outside it (e.g. next_due from payload dicts) are dropped.
+_CASE_DEFAULTS: Dict[str, Any] = {
+    "case_number": "",
+    "county": "",
+    "division": "",
+    "judge": "",
+    "case_name": "",
+    "stage": "",
+    "case_type": "Personal Injury",
+    "opposing_counsel": "",
+    "opposing_firm": "",
+    "paralegal": "",
+    "current_task": "",
+    "attention": "waiting",
+    "status": "open",
+}
+
 
 def parse_date(value: str | date | None) -> Optional[date]:
     if value is None:
         return None
     if isinstance(value, date):
         return value
-    return datetime.strptime(value, DATE_FMT).date()
+    # The format is fixed, so slice it directly instead of paying for
+    # strptime's format interpreter on every deadline.
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    raise ValueError(f"invalid date {value!r}; expected YYYY-MM-DD")
 
 
 def date_str(d: Optional[date]) -> str:
     return d.strftime(DATE_FMT) if d else ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Deadline:
     due_date: date
     description: str
@@ -46,7 +93,7 @@ class Deadline:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Case:
     id: str
     case_number: str
@@ -64,6 +111,12 @@ class Case:
     sol_date: Optional[date] = None
     deadlines: List[Deadline] = field(default_factory=list)
     status: str = "open"  # open | closed | archived
+    # Fingerprint of the last serialized form; lets save_cases skip
+    # rebuilding payloads for unchanged cases. 0 means "never serialized".
+    _payload_hash: int = field(default=0, init=False, repr=False, compare=False)
+    # (as_of, deadline) memo for next_deadline; renderers and saves ask
+    # for the same day's answer repeatedly between mutations.
+    _nd_cache: tuple = field(default=(None, None), init=False, repr=False, compare=False)
 
     @classmethod
     def new(
@@ -105,56 +158,46 @@ class Case:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Case":
-        deadlines = [Deadline.from_dict(d) for d in data.get("deadlines", [])]
-        stored_type = data.get("case_type") or "Personal Injury"
-        normalized_type = normalize_case_type(stored_type)
-        return cls(
-            id=data.get("id") or str(uuid.uuid4()),
-            case_number=data.get("case_number", ""),
-            county=data.get("county", ""),
-            division=data.get("division", ""),
-            judge=data.get("judge", ""),
-            case_name=data.get("case_name", ""),
-            stage=data.get("stage", ""),
-            case_type=normalized_type,
-            opposing_counsel=data.get("opposing_counsel", ""),
-            opposing_firm=data.get("opposing_firm", ""),
-            paralegal=data.get("paralegal", ""),
-            current_task=data.get("current_task", ""),
-            attention=data.get("attention", "waiting"),
-            sol_date=parse_date(data.get("sol_date")) if data.get("sol_date") else None,
-            deadlines=deadlines,
-            status=data.get("status", "open"),
-        )
+        merged = {**_CASE_DEFAULTS, **data}
+        kwargs = {key: merged[key] for key in _CASE_DEFAULTS}
+        kwargs["id"] = merged.get("id") or str(uuid.uuid4())
+        kwargs["case_type"] = normalize_case_type(kwargs["case_type"] or "Personal Injury")
+        sol_date = merged.get("sol_date")
+        kwargs["sol_date"] = parse_date(sol_date) if sol_date else None
+        deadlines = list(map(Deadline.from_dict, merged.get("deadlines") or ()))
+        # Keep the sorted-by-due-date invariant next_deadline relies on.
+        deadlines.sort(key=_DUE_DATE_KEY)
+        kwargs["deadlines"] = deadlines
+        return cls(**kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "case_number": self.case_number,
-            "county": self.county,
-            "division": self.division,
-            "judge": self.judge,
-            "case_name": self.case_name,
-            "stage": self.stage,
-            "case_type": self.case_type,
-            "opposing_counsel": self.opposing_counsel,
-            "opposing_firm": self.opposing_firm,
-            "paralegal": self.paralegal,
-            "current_task": self.current_task,
-            "attention": self.attention,
-            "sol_date": date_str(self.sol_date) if self.sol_date else None,
-            "deadlines": [d.to_dict() for d in self.deadlines],
-            "status": self.status,
-        }
+        data = dict(zip(_CASE_PLAIN_KEYS, _CASE_FIELD_GETTER(self)))
+        data["sol_date"] = date_str(self.sol_date) if self.sol_date else None
+        data["deadlines"] = [d.to_dict() for d in self.deadlines]
+        return data
 
     def next_deadline(self, as_of: Optional[date] = None) -> Optional[Deadline]:
         as_of = as_of or date.today()
-        upcoming = [d for d in self.deadlines if not d.resolved and d.due_date >= as_of]
-        upcoming.sort(key=lambda d: d.due_date)
-        return upcoming[0] if upcoming else None
+        cached_day, cached = self._nd_cache
+        if cached_day == as_of:
+            return cached
+        # deadlines stay sorted by due_date (from_dict/add_deadline), so
+        # the first unresolved hit is the answer — no per-call sort.
+        answer = None
+        for deadline in self.deadlines:
+            if not deadline.resolved and deadline.due_date >= as_of:
+                answer = deadline
+                break
+        self._nd_cache = (as_of, answer)
+        return answer
 
     def add_deadline(self, due_date: str | date, description: str) -> None:
         parsed_date = parse_date(due_date)
         if parsed_date is None:
             raise ValueError("due_date is required")
-        self.deadlines.append(Deadline(due_date=parsed_date, description=description, resolved=False))
\ No newline at end of file
+        insort(
+            self.deadlines,
+            Deadline(due_date=parsed_date, description=description, resolved=False),
+            key=_DUE_DATE_KEY,
+        )
+        self._nd_cache = (None, None)
\ No newline at end of file
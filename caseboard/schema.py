@@ -1,26 +1,103 @@
 from __future__ import annotations
 
+import re
 from datetime import date, datetime, timezone
+from functools import lru_cache
+from operator import methodcaller
 from typing import List, Literal, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator
+# Submodule imports skip pydantic's lazy top-level __getattr__ dispatch,
+# shaving a little off cold start for the portable app.
+from pydantic.fields import Field
+from pydantic.functional_validators import field_validator, model_validator
+from pydantic.main import BaseModel
 
 from .constants import normalize_case_type
 
 MAX_FOCUS_LENGTH = 280
 APP_SCHEMA_VERSION = 2
 
+_ALLOWED_STATUSES = frozenset({"open", "filed", "pre-filing", "closed", "archived"})
+
+
+_WS_RE = re.compile(r"\s+")
+
+_TO_CASE_DICT = methodcaller("to_case_dict")
+
+# Bound once so the default factory skips a LOAD_ATTR per construction.
+_utcnow = datetime.utcnow
+
+
+@lru_cache(maxsize=4096)
+def _clean_cached(text: str, max_length: int) -> str:
+    if _WS_RE.search(text) is None:
+        # Single-token fields (case numbers, one-word names) need no work.
+        cleaned = text
+    else:
+        cleaned = _WS_RE.sub(" ", text).strip()
+    if 0 <= max_length < len(cleaned):
+        return cleaned[:max_length]
+    return cleaned
+
 
 def _clean(text: Optional[str], *, max_length: Optional[int] = None) -> str:
-    if text is None:
+    # Field values (counties, judges, paralegals, types) repeat heavily
+    # across a caseload, so whitespace collapsing is memoized.
+    if not text:
         return ""
-    cleaned = " ".join(text.strip().split())
-    if max_length is not None and len(cleaned) > max_length:
-        return cleaned[:max_length]
+    return _clean_cached(text, -1 if max_length is None else max_length)
+
+
+def _coerce_case_number(value: Optional[str]) -> str:
+    cleaned = _clean(value)
+    if not cleaned:
+        raise ValueError("case number is required")
     return cleaned
 
 
+def _normalize_case_type_value(value: Optional[str]) -> str:
+    return normalize_case_type(value or "Personal Injury")
+
+
+def _cap_focus(value: Optional[str]) -> str:
+    return _clean(value, max_length=MAX_FOCUS_LENGTH)
+
+
+def _coerce_next_due(value: Optional[str]) -> Optional[str]:
+    cleaned = _clean(value)
+    if not cleaned:
+        return None
+    # Fixed-shape check; strptime's format interpreter is overkill
+    # for validating a date we keep as a string anyway.
+    if len(cleaned) != 10 or cleaned[4] != "-" or cleaned[7] != "-":
+        raise ValueError("next_due must be YYYY-MM-DD")
+    try:
+        date(int(cleaned[0:4]), int(cleaned[5:7]), int(cleaned[8:10]))
+    except ValueError as exc:  # pragma: no cover - validated upstream
+        raise ValueError("next_due must be YYYY-MM-DD") from exc
+    return cleaned
+
+
+# Per-field cleaners applied in one pass by CasePayload's before-model
+# validator (one Python hook per payload instead of a pydantic-core
+# dispatch per field) and reused by assign_field for single-field edits.
+_FIELD_CLEANERS = {
+    "case_number": _coerce_case_number,
+    "case_name": _clean,
+    "case_type": _normalize_case_type_value,
+    "stage": _clean,
+    "paralegal": _clean,
+    "current_task": _cap_focus,
+    "next_due": _coerce_next_due,
+    "county": _clean,
+    "division": _clean,
+    "judge": _clean,
+    "opposing_counsel": _clean,
+    "opposing_firm": _clean,
+}
+
+
 class DeadlinePayload(BaseModel):
     due_date: date
     description: str = ""
@@ -62,69 +139,83 @@ class CasePayload(BaseModel):
         "json_encoders": {datetime: lambda value: value.isoformat()},
     }
 
-    @field_validator("case_number", mode="before")
-    @classmethod
-    def _coerce_case_number(cls, value: str) -> str:
-        cleaned = _clean(value)
-        if not cleaned:
-            raise ValueError("case number is required")
-        return cleaned
-
-    @field_validator("case_name", "stage", "paralegal", "county", "division", "judge", "opposing_counsel", "opposing_firm", mode="before")
-    @classmethod
-    def _trim_text_fields(cls, value: Optional[str]) -> str:
-        return _clean(value)
-
-    @field_validator("case_type", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def _normalize_case_type(cls, value: Optional[str]) -> str:
-        return normalize_case_type(value or "Personal Injury")
-
-    @field_validator("current_task", mode="before")
-    @classmethod
-    def _cap_focus(cls, value: Optional[str]) -> str:
-        return _clean(value, max_length=MAX_FOCUS_LENGTH)
+    def _clean_fields(cls, data: object) -> object:
+        if not isinstance(data, dict):
+            return data
+        for name, cleaner in _FIELD_CLEANERS.items():
+            if name in data:
+                data[name] = cleaner(data[name])
+        return data
 
     @field_validator("status")
     @classmethod
     def _normalize_status(cls, value: str) -> str:
         if value is None:
             return "open"
+        if value in _ALLOWED_STATUSES:
+            # Values from our own files are already normalized.
+            return value
         cleaned = value.strip().lower()
-        allowed = {"open", "filed", "pre-filing", "closed", "archived"}
-        if cleaned not in allowed:
+        if cleaned not in _ALLOWED_STATUSES:
             raise ValueError(f"invalid status '{value}'")
         return cleaned
 
-    @field_validator("next_due", mode="before")
-    @classmethod
-    def _coerce_next_due(cls, value: Optional[str]) -> Optional[str]:
-        cleaned = _clean(value)
-        if not cleaned:
-            return None
-        try:
-            datetime.strptime(cleaned, "%Y-%m-%d")
-        except ValueError as exc:  # pragma: no cover - validated upstream
-            raise ValueError("next_due must be YYYY-MM-DD") from exc
-        return cleaned
+    def assign_field(self, field_name: str, value: object) -> None:
+        """Validate and assign a single field in place.
+
+        The before-model validator does not fire on assignment, so the
+        field's cleaner runs here first; pydantic-core then validates
+        only that field instead of re-validating the whole model, so
+        single-field edits avoid a deep copy of the payload (and its
+        deadlines list).  Raises ValueError on bad input.
+        """
+        cleaner = _FIELD_CLEANERS.get(field_name)
+        if cleaner is not None:
+            value = cleaner(value)
+        self.__pydantic_validator__.validate_assignment(self, field_name, value)
 
-    @property
     def to_case_dict(self) -> dict:
-        data = self.model_dump(exclude_none=True)
-        data["attention"] = self.attention
-        data["current_task"] = self.current_task
-        data["deadlines"] = [deadline.model_dump(mode="json") for deadline in self.deadlines]
-        if self.sol_date:
-            data["sol_date"] = self.sol_date.isoformat()
-        else:
-            data["sol_date"] = None
+        # Hand-built rather than model_dump: the attributes are already
+        # Python-native, so a dict literal skips a full pydantic-core
+        # serializer traversal per case. Keys match the old
+        # model_dump(exclude_none=True) output: next_due is omitted when
+        # None, sol_date is always present.
+        data = {
+            "id": self.id,
+            "case_number": self.case_number,
+            "case_name": self.case_name,
+            "case_type": self.case_type,
+            "stage": self.stage,
+            "attention": self.attention,
+            "status": self.status,
+            "paralegal": self.paralegal,
+            "current_task": self.current_task,
+            "county": self.county,
+            "division": self.division,
+            "judge": self.judge,
+            "opposing_counsel": self.opposing_counsel,
+            "opposing_firm": self.opposing_firm,
+            "sol_date": self.sol_date.isoformat() if self.sol_date else None,
+            "deadlines": [
+                {
+                    "due_date": deadline.due_date.isoformat(),
+                    "description": deadline.description,
+                    "resolved": deadline.resolved,
+                }
+                for deadline in self.deadlines
+            ],
+        }
+        if self.next_due is not None:
+            data["next_due"] = self.next_due
         return data
 
 
 class CaseFileModel(BaseModel):
     schema_version: int = Field(default=APP_SCHEMA_VERSION)
     version: int = 1
-    saved_at: datetime = Field(default_factory=datetime.utcnow)
+    saved_at: datetime = Field(default_factory=_utcnow)
     cases: List[CasePayload] = Field(default_factory=list)
 
     model_config = {
@@ -138,6 +229,21 @@ class CaseFileModel(BaseModel):
         if isinstance(value, datetime):
             parsed = value
         elif isinstance(value, str):
+            # Fast path for the exact shape this code writes:
+            # utcnow().isoformat() + "Z" with microseconds, 27 chars.
+            if len(value) == 27 and value.endswith("Z") and value[10] == "T":
+                try:
+                    return datetime(
+                        int(value[0:4]),
+                        int(value[5:7]),
+                        int(value[8:10]),
+                        int(value[11:13]),
+                        int(value[14:16]),
+                        int(value[17:19]),
+                        int(value[20:26]),
+                    )
+                except ValueError:
+                    pass
             cleaned = value.strip()
             if cleaned.endswith("Z") and "+" in cleaned[:-1]:
                 cleaned = cleaned[:-1]
@@ -159,5 +265,5 @@ class CaseFileModel(BaseModel):
             "schema_version": self.schema_version,
             "version": self.version,
             "saved_at": self.saved_at.isoformat() + "Z",
-            "cases": [case.to_case_dict for case in self.cases],
+            "cases": list(map(_TO_CASE_DICT, self.cases)),
         }
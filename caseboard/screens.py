@@ -11,13 +11,72 @@ from textual.widgets import (
 )
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual import on
-from datetime import date
+import time
+from bisect import bisect_right
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Callable, Optional
 
 from .models import Case, parse_date
 from .constants import CASE_TYPE_OPTIONS, normalize_case_type
 from .data_store import CaseDataStore
 
+_DEFAULT_CASE_TYPE = CASE_TYPE_OPTIONS[0][1]
+
+# Select options built once; compose reuses them on every screen push.
+_STAGE_OPTIONS = (
+    ("Discovery", "Discovery"),
+    ("Pretrial", "Pretrial"),
+    ("Trial Ready", "Trial Ready"),
+    ("Appeal", "Appeal"),
+    ("Other", "Other"),
+)
+_ATTENTION_OPTIONS = (
+    ("Waiting", "waiting"),
+    ("Needs Attention", "needs_attention"),
+)
+_STATUS_OPTIONS = (
+    ("Pre-Filing", "pre-filing"),
+    ("Filed", "filed"),
+    ("Active", "open"),
+    ("Closed", "closed"),
+)
+
+# Deadline urgency styling, indexed by bisecting the day count over the
+# bounds: overdue / due today / within 3 days / within a week / later.
+_DEADLINE_BOUNDS = (0, 1, 4, 8)
+_DEADLINE_STYLES = (
+    ("red", "OVERDUE ({} days)"),
+    ("orange3", "DUE TODAY"),
+    ("yellow", "Due in {} days"),
+    ("white", "Due in {} days"),
+    ("dim", "Due in {} days"),
+)
+
+_STOCK_UP = ("green", "▲")
+_STOCK_DOWN = ("red", "▼")
+
+# Keys "1".."9" mapped straight to list indices for stock deletion.
+_DIGIT_MAP = {str(i): i - 1 for i in range(1, 10)}
+
+_stock_manager = None
+
+
+def _get_stock_manager():
+    """Resolve the shared StockManager once; screen pushes reuse the reference."""
+    global _stock_manager
+    if _stock_manager is None:
+        from .stocks import get_stock_manager
+        _stock_manager = get_stock_manager()
+    return _stock_manager
+
+
+@lru_cache(maxsize=512)
+def _fmt_date(d: date) -> str:
+    # The same due dates are re-rendered on every screen refresh;
+    # dates are immutable, so cache the strftime result per date.
+    return d.strftime("%m/%d/%Y")
+
 
 class ConfirmDialog(Screen):
     """A simple confirmation dialog."""
@@ -64,19 +123,99 @@ class EditCaseScreen(Screen):
         ("ctrl+s", "save", "Save"),
     ]
 
+    # (widget attribute, case attribute) pairs copied verbatim when
+    # populating the form for an edit; case_type and the date fields
+    # need special handling and are set individually. Split to match
+    # the two mount phases of the form columns.
+    _LEFT_FIELD_MAP = (
+        ("case_number_input", "case_number"),
+        ("case_name_input", "case_name"),
+        ("county_input", "county"),
+        ("division_input", "division"),
+        ("judge_input", "judge"),
+        ("stage_select", "stage"),
+        ("attention_select", "attention"),
+    )
+    _RIGHT_FIELD_MAP = (
+        ("paralegal_input", "paralegal"),
+        ("opposing_counsel_input", "opposing_counsel"),
+        ("opposing_firm_input", "opposing_firm"),
+        ("status_select", "status"),
+        ("current_task_input", "current_task"),
+    )
+
+    # Widgets read back by action_save: Inputs are stripped verbatim,
+    # Selects fall back to a default when nothing is chosen. The right-
+    # column inputs are kept separate because their reads are guarded
+    # until the deferred column has been populated.
+    _SAVE_INPUT_MAP = (
+        ("case_number_input", "case_number"),
+        ("case_name_input", "case_name"),
+        ("county_input", "county"),
+        ("division_input", "division"),
+        ("judge_input", "judge"),
+    )
+    _SAVE_SELECT_MAP = (
+        ("case_type_select", "case_type", _DEFAULT_CASE_TYPE),
+        ("stage_select", "stage", "Discovery"),
+        ("attention_select", "attention", "waiting"),
+    )
+    _SAVE_RIGHT_INPUT_MAP = (
+        ("paralegal_input", "paralegal"),
+        ("opposing_counsel_input", "opposing_counsel"),
+        ("opposing_firm_input", "opposing_firm"),
+        ("current_task_input", "current_task"),
+    )
+
     def __init__(self, on_save: Callable[[Case], None], existing_case: Case | None = None) -> None:
         super().__init__()
         self._on_save = on_save
         self.existing_case = existing_case
         self.is_editing = existing_case is not None
+        self._right_column_ready = False
+        # Normalized once here; compose and the populate pass both use it.
+        self._initial_case_type = (
+            normalize_case_type(existing_case.case_type)
+            if existing_case and existing_case.case_type
+            else _DEFAULT_CASE_TYPE
+        )
 
     def compose(self):
         title_text = "Edit Case" if self.is_editing else "Add New Case"
-        initial_case_type = (
-            normalize_case_type(self.existing_case.case_type)
-            if self.existing_case and self.existing_case.case_type
-            else CASE_TYPE_OPTIONS[0][1]
+
+        # Widgets are kept as attributes so on_mount/action_save read
+        # them directly instead of re-running a query_one per field.
+        self.case_number_input = Input(placeholder="e.g., 60CV-2024-1234", id="case_number")
+        self.case_name_input = Input(placeholder="e.g., Doe v. Acme", id="case_name")
+        self.case_type_select = Select(
+            id="case_type",
+            options=CASE_TYPE_OPTIONS,
+            value=self._initial_case_type,
+        )
+        self.county_input = Input(placeholder="e.g., Pulaski", id="county")
+        self.division_input = Input(placeholder="e.g., Civil", id="division")
+        self.judge_input = Input(placeholder="e.g., Hon. Smith", id="judge")
+        self.stage_select = Select(
+            id="stage",
+            options=_STAGE_OPTIONS,
+            value="Discovery",
+        )
+        self.attention_select = Select(
+            id="attention",
+            options=_ATTENTION_OPTIONS,
+            value="waiting",
+        )
+        self.paralegal_input = Input(placeholder="e.g., Jane Smith", id="paralegal")
+        self.opposing_counsel_input = Input(placeholder="e.g., John Doe, Esq.", id="opposing_counsel")
+        self.opposing_firm_input = Input(placeholder="e.g., Smith & Associates", id="opposing_firm")
+        self.status_select = Select(
+            id="status",
+            options=_STATUS_OPTIONS,
+            value="pre-filing",
         )
+        self.current_task_input = Input(placeholder="What is happening next?", id="current_task")
+        self.sol_date_input = Input(placeholder="YYYY-MM-DD (optional)", id="sol_date")
+        self.next_deadline_input = Input(placeholder="YYYY-MM-DD (optional)", id="next_deadline")
 
         yield Header(show_clock=False)
         yield Container(
@@ -86,66 +225,21 @@ class EditCaseScreen(Screen):
                 VerticalScroll(
                     Horizontal(
                         Vertical(
-                            Horizontal(Label("Case Number:"), Input(placeholder="e.g., 60CV-2024-1234", id="case_number"), classes="form-row"),
-                            Horizontal(Label("Case Name:"), Input(placeholder="e.g., Doe v. Acme", id="case_name"), classes="form-row"),
-                            Horizontal(Label("Case Type:"),
-                                Select(
-                                    id="case_type",
-                                    options=CASE_TYPE_OPTIONS,
-                                    value=initial_case_type,
-                                ),
-                                classes="form-row",
-                            ),
-                            Horizontal(Label("County:"), Input(placeholder="e.g., Pulaski", id="county"), classes="form-row"),
-                            Horizontal(Label("Division:"), Input(placeholder="e.g., Civil", id="division"), classes="form-row"),
-                            Horizontal(Label("Judge:"), Input(placeholder="e.g., Hon. Smith", id="judge"), classes="form-row"),
-                            Horizontal(Label("Stage:"),
-                                Select(
-                                    id="stage",
-                                    options=[
-                                        ("Discovery", "Discovery"),
-                                        ("Pretrial", "Pretrial"),
-                                        ("Trial Ready", "Trial Ready"),
-                                        ("Appeal", "Appeal"),
-                                        ("Other", "Other"),
-                                    ],
-                                    value="Discovery",
-                                ),
-                                classes="form-row",
-                            ),
-                            Horizontal(Label("Attention:"),
-                                Select(
-                                    id="attention",
-                                    options=[
-                                        ("Waiting", "waiting"),
-                                        ("Needs Attention", "needs_attention"),
-                                    ],
-                                    value="waiting",
-                                ),
-                                classes="form-row",
-                            ),
+                            Horizontal(Label("Case Number:"), self.case_number_input, classes="form-row"),
+                            Horizontal(Label("Case Name:"), self.case_name_input, classes="form-row"),
+                            Horizontal(Label("Case Type:"), self.case_type_select, classes="form-row"),
+                            Horizontal(Label("County:"), self.county_input, classes="form-row"),
+                            Horizontal(Label("Division:"), self.division_input, classes="form-row"),
+                            Horizontal(Label("Judge:"), self.judge_input, classes="form-row"),
+                            Horizontal(Label("Stage:"), self.stage_select, classes="form-row"),
+                            Horizontal(Label("Attention:"), self.attention_select, classes="form-row"),
                             classes="form-column form-column-left",
                         ),
+                        # The right column mounts after first paint (see
+                        # _mount_right_column); only this empty slot is
+                        # laid out on the initial refresh.
                         Vertical(
-                            Horizontal(Label("Paralegal:"), Input(placeholder="e.g., Jane Smith", id="paralegal"), classes="form-row"),
-                            Horizontal(Label("Opposing Counsel:"), Input(placeholder="e.g., John Doe, Esq.", id="opposing_counsel"), classes="form-row"),
-                            Horizontal(Label("Opposing Firm:"), Input(placeholder="e.g., Smith & Associates", id="opposing_firm"), classes="form-row"),
-                            Horizontal(Label("Status:"),
-                                Select(
-                                    id="status",
-                                    options=[
-                                        ("Pre-Filing", "pre-filing"),
-                                        ("Filed", "filed"),
-                                        ("Active", "open"),
-                                        ("Closed", "closed"),
-                                    ],
-                                    value="pre-filing",
-                                ),
-                                classes="form-row",
-                            ),
-                            Horizontal(Label("Current Focus:"), Input(placeholder="What is happening next?", id="current_task"), classes="form-row"),
-                            Horizontal(Label("Statute of Limitations:"), Input(placeholder="YYYY-MM-DD (optional)", id="sol_date"), classes="form-row"),
-                            Horizontal(Label("Next Deadline:"), Input(placeholder="YYYY-MM-DD (optional)", id="next_deadline"), classes="form-row"),
+                            id="right-col-slot",
                             classes="form-column",
                         ),
                         id="form-fields",
@@ -165,37 +259,37 @@ class EditCaseScreen(Screen):
 
     def on_mount(self) -> None:
         """Focus the first input field and populate form if editing."""
-        # Ensure all inputs are enabled and focusable
-        for input_widget in self.query(Input):
-            input_widget.disabled = False
-        
-        self.query_one("#case_number", Input).focus()
-        
+        self.case_number_input.focus()
+
         if self.is_editing and self.existing_case:
             # Populate form fields with existing case data
-            self.query_one("#case_number", Input).value = self.existing_case.case_number
-            self.query_one("#case_name", Input).value = self.existing_case.case_name
-            normalized_type = (
-                normalize_case_type(self.existing_case.case_type)
-                if self.existing_case.case_type
-                else CASE_TYPE_OPTIONS[0][1]
-            )
-            self.query_one("#case_type", Select).value = normalized_type
-            self.query_one("#county", Input).value = self.existing_case.county
-            self.query_one("#division", Input).value = self.existing_case.division
-            self.query_one("#judge", Input).value = self.existing_case.judge
-            self.query_one("#paralegal", Input).value = self.existing_case.paralegal
-            self.query_one("#opposing_counsel", Input).value = self.existing_case.opposing_counsel
-            self.query_one("#opposing_firm", Input).value = self.existing_case.opposing_firm
-            self.query_one("#stage", Select).value = self.existing_case.stage
-            self.query_one("#status", Select).value = self.existing_case.status
-            self.query_one("#current_task", Input).value = self.existing_case.current_task
-            self.query_one("#attention", Select).value = self.existing_case.attention
+            for widget_attr, case_attr in self._LEFT_FIELD_MAP:
+                getattr(self, widget_attr).value = getattr(self.existing_case, case_attr)
+            # case_type was already seeded from _initial_case_type in compose.
+
+        # Mount the right column once the left half has painted, so the
+        # dialog appears after roughly half the layout work.
+        self.call_after_refresh(self._mount_right_column)
+
+    def _mount_right_column(self) -> None:
+        self.query_one("#right-col-slot", Vertical).mount(
+            Horizontal(Label("Paralegal:"), self.paralegal_input, classes="form-row"),
+            Horizontal(Label("Opposing Counsel:"), self.opposing_counsel_input, classes="form-row"),
+            Horizontal(Label("Opposing Firm:"), self.opposing_firm_input, classes="form-row"),
+            Horizontal(Label("Status:"), self.status_select, classes="form-row"),
+            Horizontal(Label("Current Focus:"), self.current_task_input, classes="form-row"),
+            Horizontal(Label("Statute of Limitations:"), self.sol_date_input, classes="form-row"),
+            Horizontal(Label("Next Deadline:"), self.next_deadline_input, classes="form-row"),
+        )
+        if self.is_editing and self.existing_case:
+            for widget_attr, case_attr in self._RIGHT_FIELD_MAP:
+                getattr(self, widget_attr).value = getattr(self.existing_case, case_attr)
             if self.existing_case.sol_date:
-                self.query_one("#sol_date", Input).value = self.existing_case.sol_date.strftime("%Y-%m-%d")
+                self.sol_date_input.value = self.existing_case.sol_date.strftime("%Y-%m-%d")
             next_deadline_obj = self.existing_case.next_deadline()
             if next_deadline_obj and next_deadline_obj.due_date:
-                self.query_one("#next_deadline", Input).value = next_deadline_obj.due_date.strftime("%Y-%m-%d")
+                self.next_deadline_input.value = next_deadline_obj.due_date.strftime("%Y-%m-%d")
+        self._right_column_ready = True
 
     @on(Button.Pressed, "#cancel")
     def cancel(self) -> None:
@@ -206,28 +300,33 @@ class EditCaseScreen(Screen):
         self.action_save()
 
     def action_save(self) -> None:
-        case_number = self.query_one("#case_number", Input).value.strip()
-        case_name = self.query_one("#case_name", Input).value.strip()
-        case_type_value = self.query_one("#case_type", Select).value
-        default_case_type = CASE_TYPE_OPTIONS[0][1]
-        case_type = str(case_type_value) if case_type_value else default_case_type
-        county = self.query_one("#county", Input).value.strip()
-        division = self.query_one("#division", Input).value.strip()
-        judge = self.query_one("#judge", Input).value.strip()
-        paralegal = self.query_one("#paralegal", Input).value.strip()
-        opposing_counsel = self.query_one("#opposing_counsel", Input).value.strip()
-        opposing_firm = self.query_one("#opposing_firm", Input).value.strip()
-        stage_value = self.query_one("#stage", Select).value
-        stage = str(stage_value) if stage_value else "Discovery"
-        attention_value = self.query_one("#attention", Select).value
-        attention = str(attention_value) if attention_value else "waiting"
-        status_value = self.query_one("#status", Select).value
-        status = str(status_value) if status_value else "pre-filing"
-        current_task = self.query_one("#current_task", Input).value.strip()
-        sol_text = self.query_one("#sol_date", Input).value.strip() or None
-        next_deadline_text = self.query_one("#next_deadline", Input).value.strip() or None
-
-        if not case_number or not case_name:
+        values = {
+            name: getattr(self, widget_attr).value.strip()
+            for widget_attr, name in self._SAVE_INPUT_MAP
+        }
+        for widget_attr, name, default in self._SAVE_SELECT_MAP:
+            selected = getattr(self, widget_attr).value
+            values[name] = str(selected) if selected else default
+
+        if self._right_column_ready or not self.is_editing:
+            for widget_attr, name in self._SAVE_RIGHT_INPUT_MAP:
+                values[name] = getattr(self, widget_attr).value.strip()
+            status_value = self.status_select.value
+            values["status"] = str(status_value) if status_value else "pre-filing"
+            sol_text = self.sol_date_input.value.strip() or None
+            next_deadline_text = self.next_deadline_input.value.strip() or None
+        else:
+            # Save landed before the deferred right column was populated;
+            # the user cannot have touched those fields yet, so keep the
+            # case's stored values.
+            existing = self.existing_case
+            for _, name in self._SAVE_RIGHT_INPUT_MAP:
+                values[name] = getattr(existing, name)
+            values["status"] = existing.status
+            sol_text = existing.sol_date.strftime("%Y-%m-%d") if existing.sol_date else None
+            next_deadline_text = None
+
+        if not values["case_number"] or not values["case_name"]:
             self.app.bell()
             return
 
@@ -235,52 +334,20 @@ class EditCaseScreen(Screen):
             # Update existing case
             case = Case(
                 id=self.existing_case.id,
-                case_number=case_number,
-                case_name=case_name,
-                case_type=case_type,
-                county=county,
-                division=division,
-                judge=judge,
-                paralegal=paralegal,
-                current_task=current_task,
-                attention=attention,
-                opposing_counsel=opposing_counsel,
-                opposing_firm=opposing_firm,
-                stage=stage,
                 sol_date=parse_date(sol_text) if sol_text else None,
                 deadlines=self.existing_case.deadlines,
+                **values,
             )
-            # Set the status after creating the case
-            case.status = status
-            # Update next deadline if provided
-            if next_deadline_text:
-                deadline_date = parse_date(next_deadline_text)
-                if deadline_date:
-                    case.add_deadline(deadline_date, "Next Deadline")
         else:
             # Create new case
-            case = Case.new(
-                case_number=case_number,
-                case_name=case_name,
-                case_type=case_type,
-                county=county,
-                division=division,
-                judge=judge,
-                paralegal=paralegal,
-                opposing_counsel=opposing_counsel,
-                opposing_firm=opposing_firm,
-                stage=stage,
-                sol_date=sol_text,
-                current_task=current_task,
-                attention=attention,
-                status=status,
-            )
-            # Set next deadline if provided
-            if next_deadline_text:
-                deadline_date = parse_date(next_deadline_text)
-                if deadline_date:
-                    case.add_deadline(deadline_date, "Next Deadline")
-        
+            case = Case.new(sol_date=sol_text, **values)
+
+        # Update next deadline if provided
+        if next_deadline_text:
+            deadline_date = parse_date(next_deadline_text)
+            if deadline_date:
+                case.add_deadline(deadline_date, "Next Deadline")
+
         self._on_save(case)
         self.app.pop_screen()
 
@@ -300,21 +367,26 @@ class DeadlineScreen(Screen):
         self._on_save = on_save
 
     def compose(self):
+        # Kept as attributes so the add/render paths skip query_one.
+        self.date_input = Input(placeholder="YYYY-MM-DD", id="new-deadline-date")
+        self.desc_input = Input(placeholder="Description of deadline", id="new-deadline-desc")
+        self.deadlines_list = Static(id="deadlines-list")
+
         yield Header(show_clock=False)
         yield Container(
             Vertical(
                 Label(f"Deadlines for: {self.case.case_name}", id="deadline-title"),
-                
+
                 # Add new deadline form
                 Vertical(
                     Label("Add New Deadline:", id="add-deadline-label"),
                     Horizontal(
-                        Label("Date:"), 
-                        Input(placeholder="YYYY-MM-DD", id="new-deadline-date")
+                        Label("Date:"),
+                        self.date_input
                     ),
                     Horizontal(
-                        Label("Description:"), 
-                        Input(placeholder="Description of deadline", id="new-deadline-desc")
+                        Label("Description:"),
+                        self.desc_input
                     ),
                     Horizontal(
                         Button.success("Add (Ctrl+S)", id="add-deadline"),
@@ -322,11 +394,11 @@ class DeadlineScreen(Screen):
                     ),
                     id="add-deadline-form",
                 ),
-                
+
                 # List existing deadlines
                 Label("Existing Deadlines:", id="existing-deadlines-label"),
-                Static(id="deadlines-list"),
-                
+                self.deadlines_list,
+
                 Horizontal(
                     Button("Close", id="close"),
                     id="buttons",
@@ -339,47 +411,50 @@ class DeadlineScreen(Screen):
 
     def on_mount(self) -> None:
         """Focus the date input and render deadlines."""
-        self.query_one("#new-deadline-date", Input).focus()
+        self.date_input.focus()
+        # One date.today() per screen life instead of per render; the
+        # hourly tick catches the screen being left open past midnight.
+        self._today = date.today()
+        self.set_interval(3600, self._refresh_today)
         self.render_deadlines()
 
+    def _refresh_today(self) -> None:
+        today = date.today()
+        if today != self._today:
+            self._today = today
+            self.render_deadlines()
+
     def render_deadlines(self) -> None:
         """Render the list of existing deadlines."""
-        deadlines_widget = self.query_one("#deadlines-list", Static)
-        
+        deadlines_widget = self.deadlines_list
+
         if not self.case.deadlines:
             deadlines_widget.update("[dim]No deadlines set[/]")
             return
         
-        lines = []
-        today = date.today()
-        for i, deadline in enumerate(self.case.deadlines):
-            if deadline.resolved:
-                continue
-                
-            days = (deadline.due_date - today).days
-            if days < 0:
-                color = "red"
-                status = f"OVERDUE ({abs(days)} days)"
-            elif days == 0:
-                color = "orange3"
-                status = "DUE TODAY"
-            elif days <= 3:
-                color = "yellow"
-                status = f"Due in {days} days"
-            elif days <= 7:
-                color = "white"
-                status = f"Due in {days} days"
-            else:
-                color = "dim"
-                status = f"Due in {days} days"
-            
-            lines.append(f"[{color}]{i+1:2d}. {deadline.due_date.strftime('%m/%d/%Y')} - {deadline.description}[/]")
-            lines.append(f"     [{color}]{status}[/]\n")
-        
-        if not lines:
+        # Filter resolved entries in one comprehension pass up front;
+        # numbering still reflects positions in the full list.
+        active = [
+            (i, deadline)
+            for i, deadline in enumerate(self.case.deadlines)
+            if not deadline.resolved
+        ]
+        if not active:
             deadlines_widget.update("[dim]All deadlines resolved[/]")
-        else:
-            deadlines_widget.update("\n".join(lines))
+            return
+
+        today = self._today
+
+        def blocks():
+            for i, deadline in active:
+                days = (deadline.due_date - today).days
+                color, status_fmt = _DEADLINE_STYLES[bisect_right(_DEADLINE_BOUNDS, days)]
+                yield (
+                    f"[{color}]{i+1:2d}. {_fmt_date(deadline.due_date)} - {deadline.description}[/]\n"
+                    f"     [{color}]{status_fmt.format(abs(days))}[/]\n"
+                )
+
+        deadlines_widget.update("\n".join(blocks()))
 
     @on(Button.Pressed, "#add-deadline")
     def add_deadline_button(self) -> None:
@@ -391,29 +466,30 @@ class DeadlineScreen(Screen):
 
     def action_add_deadline(self) -> None:
         """Add a new deadline to the case."""
-        date_text = self.query_one("#new-deadline-date", Input).value.strip()
-        desc_text = self.query_one("#new-deadline-desc", Input).value.strip()
-        
+        date_text = self.date_input.value.strip()
+        desc_text = self.desc_input.value.strip()
+
         if not date_text or not desc_text:
             self.app.bell()
             return
-        
+
         deadline_date = parse_date(date_text)
         if not deadline_date:
             self.app.bell()
             return
-        
+
         # Add deadline to case
         self.case.add_deadline(deadline_date, desc_text)
-        
+
         # Clear form
-        self.query_one("#new-deadline-date", Input).value = ""
-        self.query_one("#new-deadline-desc", Input).value = ""
-        self.query_one("#new-deadline-date", Input).focus()
-        
-        # Re-render deadlines
-        self.render_deadlines()
-        
+        self.date_input.value = ""
+        self.desc_input.value = ""
+        self.date_input.focus()
+
+        # Re-render after the cleared inputs paint, so the keystroke
+        # gets its feedback before the list rebuild runs.
+        self.call_after_refresh(self.render_deadlines)
+
         # Save the case
         self._on_save(self.case)
 
@@ -423,111 +499,9 @@ class DeadlineScreen(Screen):
         pass
 
 
-class StockManagementScreen(Screen):
-    """Screen for managing tracked stocks."""
-    
-    BINDINGS = [
-        ("escape", "app.pop_screen", "Cancel"),
-        ("ctrl+s", "add_stock", "Add Stock"),
-        ("d", "delete_selected", "Delete Stock"),
-    ]
-
-    def __init__(self) -> None:
-        super().__init__()
-        from .stocks import get_stock_manager
-        self.stock_manager = get_stock_manager()
-
-    def compose(self):
-        yield Header(show_clock=False)
-        yield Container(
-            Vertical(
-                Label("Stock Management", id="stock-title"),
-                
-                # Add new stock form
-                Vertical(
-                    Label("Add New Stock:", id="add-stock-label"),
-                    Horizontal(
-                        Label("Symbol:"), 
-                        Input(placeholder="e.g., AAPL", id="new-stock-symbol")
-                    ),
-                    Horizontal(
-                        Button.success("Add (Ctrl+S)", id="add-stock"),
-                        id="add-stock-buttons"
-                    ),
-                    id="add-stock-form",
-                ),
-                
-                # List current stocks
-                Label("Currently Tracked Stocks:", id="current-stocks-label"),
-                Static(id="stocks-list"),
-                
-                Horizontal(
-                    Button("Close", id="close"),
-                    id="buttons",
-                ),
-                id="stock-form",
-            ),
-            id="stock-container",
-        )
-        yield Footer()
-
-    def on_mount(self) -> None:
-        """Focus the symbol input and render stocks."""
-        self.query_one("#new-stock-symbol", Input).focus()
-        self.render_stocks()
-
-    def render_stocks(self) -> None:
-        """Render the list of current stocks."""
-        stocks_widget = self.query_one("#stocks-list", Static)
-        
-        symbols = self.stock_manager.stock_symbols
-        if not symbols:
-            stocks_widget.update("[dim]No stocks being tracked[/]")
-            return
-        
-        lines = []
-        for i, symbol in enumerate(symbols):
-            lines.append(f"[white]{i+1:2d}. {symbol}[/]")
-        
-        lines.append(f"\n[dim]Total: {len(symbols)} stocks[/]")
-        lines.append("[dim]Press 'd' to delete selected stock[/]")
-        
-        stocks_widget.update("\n".join(lines))
-
-    @on(Button.Pressed, "#add-stock")
-    def add_stock_button(self) -> None:
-        self.action_add_stock()
-
-    @on(Button.Pressed, "#close")
-    def close(self) -> None:
-        self.app.pop_screen()
-
-    def action_add_stock(self) -> None:
-        """Add a new stock to tracking."""
-        symbol_input = self.query_one("#new-stock-symbol", Input)
-        symbol = symbol_input.value.strip().upper()
-        
-        if not symbol:
-            self.app.bell()
-            return
-        
-        if self.stock_manager.add_stock(symbol):
-            symbol_input.value = ""
-            symbol_input.focus()
-            self.render_stocks()
-        else:
-            self.app.bell()  # Symbol already exists or invalid
-
-    def action_delete_selected(self) -> None:
-        """Delete a stock (would need selection mechanism)."""
-        # For now, just show a message that this feature needs implementation
-        # In a full implementation, you'd add a selection mechanism
-        pass
-
-
 class StockManagementScreen(Screen):
     """Screen for managing stock ticker symbols."""
-    
+
     BINDINGS = [
         ("escape", "app.pop_screen", "Cancel"),
         ("ctrl+s", "add_stock", "Add Stock"),
@@ -535,23 +509,43 @@ class StockManagementScreen(Screen):
         ("r", "refresh_stocks", "Refresh"),
     ]
 
+    # How long a fetched stock payload stays good for redraws.
+    _STOCK_TTL = 30.0
+
     def __init__(self) -> None:
         super().__init__()
-        from .stocks import get_stock_manager
-        self.stock_manager = get_stock_manager()
+        self.stock_manager = _get_stock_manager()
+        self._cached_data: tuple[float, list] = (0.0, [])
+
+    def _get_stocks_data(self) -> list:
+        """Return stock data, refetching only when the TTL has lapsed."""
+        now = time.monotonic()
+        cached_at, data = self._cached_data
+        if now - cached_at < self._STOCK_TTL:
+            return data
+        data = self.stock_manager.get_all_stock_data()
+        self._cached_data = (now, data)
+        return data
+
+    def _invalidate_stocks_cache(self) -> None:
+        self._cached_data = (0.0, [])
 
     def compose(self):
+        # Kept as attributes so the add/render paths skip query_one.
+        self.symbol_input = Input(placeholder="e.g., AAPL", id="new-stock-symbol")
+        self.stocks_list = Static(id="stocks-list")
+
         yield Header(show_clock=False)
         yield Container(
             Vertical(
                 Label("Stock Ticker Management", id="stock-title"),
-                
+
                 # Add new stock form
                 Vertical(
                     Label("Add New Stock:", id="add-stock-label"),
                     Horizontal(
-                        Label("Symbol:"), 
-                        Input(placeholder="e.g., AAPL", id="new-stock-symbol")
+                        Label("Symbol:"),
+                        self.symbol_input
                     ),
                     Horizontal(
                         Button.success("Add Stock (Ctrl+S)", id="add-stock"),
@@ -559,10 +553,10 @@ class StockManagementScreen(Screen):
                     ),
                     id="add-stock-form",
                 ),
-                
+
                 # List existing stocks
                 Label("Current Stocks:", id="current-stocks-label"),
-                Static(id="stocks-list"),
+                self.stocks_list,
                 
                 Horizontal(
                     Button.success("Refresh Data (r)", id="refresh"),
@@ -577,37 +571,42 @@ class StockManagementScreen(Screen):
 
     def on_mount(self) -> None:
         """Focus the symbol input and render stocks."""
-        self.query_one("#new-stock-symbol", Input).focus()
+        self.symbol_input.focus()
         self.render_stocks()
 
     def render_stocks(self) -> None:
         """Render the list of current stocks with their data."""
-        stocks_widget = self.query_one("#stocks-list", Static)
-        
+        stocks_widget = self.stocks_list
+
         try:
-            stocks_data = self.stock_manager.get_all_stock_data()
-            
+            stocks_data = self._get_stocks_data()
+
             if not stocks_data:
                 stocks_widget.update("[dim]No stocks configured[/]")
                 return
             
-            lines = []
-            for i, stock in enumerate(stocks_data):
-                # Color coding for changes
-                if stock.change >= 0:
-                    color = "green"
-                    arrow = "▲"
-                else:
-                    color = "red" 
-                    arrow = "▼"
-                
-                lines.append(f"[white]{i+1:2d}. {stock.symbol:6s}[/] [white]${stock.price:8.2f}[/] [{color}]{arrow}{stock.change_str:8s} ({stock.change_percent_str:7s})[/]")
-            
-            from datetime import datetime
-            lines.append(f"\n[dim]Last updated: {datetime.now().strftime('%I:%M:%S %p')}[/]")
-            lines.append(f"[dim]Press 'd' + number to remove a stock[/]")
-            
-            stocks_widget.update("\n".join(lines))
+            # A list comprehension rather than a genexp: str.join
+            # materializes its argument anyway, so building the list in
+            # one C-level pass avoids the generator round-trips.
+            body = "\n".join(
+                [
+                    "[white]{:2d}. {:6s}[/] [white]${:8.2f}[/] [{}]{}{:8s} ({:7s})[/]".format(
+                        i + 1,
+                        stock.symbol,
+                        stock.price,
+                        *(_STOCK_UP if stock.change >= 0 else _STOCK_DOWN),
+                        stock.change_str,
+                        stock.change_percent_str,
+                    )
+                    for i, stock in enumerate(stocks_data)
+                ]
+            )
+
+            stocks_widget.update(
+                f"{body}\n"
+                f"\n[dim]Last updated: {datetime.now().strftime('%I:%M:%S %p')}[/]\n"
+                f"[dim]Press 'd' + number to remove a stock[/]"
+            )
             
         except Exception as e:
             stocks_widget.update(f"[red]Error loading stocks: {e}[/]")
@@ -626,26 +625,29 @@ class StockManagementScreen(Screen):
 
     def action_add_stock(self) -> None:
         """Add a new stock to the ticker."""
-        symbol_text = self.query_one("#new-stock-symbol", Input).value.strip().upper()
-        
+        symbol_text = self.symbol_input.value.strip().upper()
+
         if not symbol_text:
             self.app.bell()
             return
-        
+
         if self.stock_manager.add_stock(symbol_text):
             # Clear form
-            self.query_one("#new-stock-symbol", Input).value = ""
-            self.query_one("#new-stock-symbol", Input).focus()
-            
-            # Re-render stocks
-            self.render_stocks()
+            self.symbol_input.value = ""
+            self.symbol_input.focus()
+
+            # Re-render after the cleared input paints (refetch so the
+            # new symbol shows up)
+            self._invalidate_stocks_cache()
+            self.call_after_refresh(self.render_stocks)
         else:
             self.app.bell()  # Stock already exists or invalid
 
     def action_refresh_stocks(self) -> None:
         """Refresh all stock data."""
+        self._invalidate_stocks_cache()
         self.stock_manager.refresh_all_data()
-        self.render_stocks()
+        self.call_after_refresh(self.render_stocks)
 
     def action_delete_stock(self) -> None:
         """Delete a stock (simplified - remove first stock for now)."""
@@ -655,16 +657,16 @@ class StockManagementScreen(Screen):
 
     def on_key(self, event) -> None:
         """Handle key events for stock deletion."""
-        if event.key.isdigit():
-            # User pressed a number - delete that stock
-            try:
-                index = int(event.key) - 1
-                if 0 <= index < len(self.stock_manager.stock_symbols):
-                    symbol = self.stock_manager.stock_symbols[index]
-                    self.stock_manager.remove_stock(symbol)
-                    self.render_stocks()
-            except (ValueError, IndexError):
-                pass
+        # One dict lookup replaces isdigit/int plus try/except setup on
+        # every keypress.
+        index = _DIGIT_MAP.get(event.key)
+        if index is None:
+            return
+        symbols = self.stock_manager.stock_symbols
+        if index < len(symbols):
+            self.stock_manager.remove_stock(symbols[index])
+            self._invalidate_stocks_cache()
+            self.render_stocks()
 
 
 class FocusHistoryScreen(Screen):
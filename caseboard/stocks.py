@@ -3,19 +3,48 @@ Stock ticker management for live stock data display.
 Uses Alpha Vantage API for real stock data with fallback to mock data.
 """
 from __future__ import annotations
+import atexit
 import json
 import requests
+import threading
+from random import Random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Default stock symbols to track
 DEFAULT_STOCKS = [
-    "AAPL", "MSFT", "GOOGL", "TSLA", "AMZN", 
+    "AAPL", "MSFT", "GOOGL", "TSLA", "AMZN",
     "META", "NVDA", "NFLX", "JPM", "V"
 ]
 
+# Base prices for mock data when the live API is unavailable
+_BASE_PRICES = {
+    "AAPL": 185.43, "MSFT": 378.92, "GOOGL": 142.56, "TSLA": 248.73,
+    "AMZN": 144.89, "META": 521.04, "NVDA": 876.45, "NFLX": 452.18,
+    "JPM": 198.76, "V": 289.34
+}
+_RNG = Random()
+
+# Shared session keeps the TCP+TLS connection to the quote API alive
+# across symbols instead of handshaking per request.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
+# Persisted cache entries older than this are discarded on startup.
+CACHE_TTL = timedelta(minutes=5)
+# Flush the cache file after this many updates (plus once at exit).
+_CACHE_FLUSH_EVERY = 5
+
 @dataclass
 class StockData:
     symbol: str
@@ -48,7 +77,12 @@ class StockManager:
         self.cache_file = os.path.join(data_dir, "stock_cache.json")
         self.api_key = None  # We'll use free APIs that don't require keys initially
         self.stock_symbols = self.load_stock_symbols()
-        self.cache: Dict[str, StockData] = {}
+        # Parallel set for O(1) membership checks; the list keeps order.
+        self._symbol_set = set(self.stock_symbols)
+        self.cache: Dict[str, StockData] = self._load_cache()
+        self._cache_lock = threading.Lock()
+        self._pending_cache_writes = 0
+        atexit.register(self._save_cache)
         self.last_fetch = None
         
     def load_stock_symbols(self) -> List[str]:
@@ -73,26 +107,85 @@ class StockManager:
                 }, f, indent=2)
         except Exception as e:
             print(f"Error saving stock symbols: {e}")
-    
+
+    def _load_cache(self) -> Dict[str, StockData]:
+        """Load persisted quotes, discarding entries older than CACHE_TTL."""
+        try:
+            if not os.path.exists(self.cache_file):
+                return {}
+            with open(self.cache_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            cutoff = datetime.now() - CACHE_TTL
+            cache = {}
+            for symbol, entry in data.items():
+                last_updated = datetime.fromisoformat(entry['last_updated'])
+                if last_updated >= cutoff:
+                    cache[symbol] = StockData(
+                        symbol=symbol,
+                        price=entry['price'],
+                        change=entry['change'],
+                        change_percent=entry['change_percent'],
+                        last_updated=last_updated
+                    )
+            return cache
+        except Exception:
+            return {}
+
+    def _save_cache(self) -> None:
+        """Atomically persist the quote cache so restarts skip the API."""
+        try:
+            payload = {
+                symbol: {
+                    'price': data.price,
+                    'change': data.change,
+                    'change_percent': data.change_percent,
+                    'last_updated': data.last_updated.isoformat()
+                }
+                for symbol, data in self.cache.items()
+            }
+            if orjson is not None:
+                raw = orjson.dumps(payload)
+            else:
+                raw = json.dumps(payload).encode('utf-8')
+            os.makedirs(self.data_dir, exist_ok=True)
+            tmp_file = self.cache_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"Error saving stock cache: {e}")
+
+    def _note_cache_update(self) -> None:
+        """Count cache inserts, flushing to disk every few updates."""
+        with self._cache_lock:
+            self._pending_cache_writes += 1
+            if self._pending_cache_writes < _CACHE_FLUSH_EVERY:
+                return
+            self._pending_cache_writes = 0
+            self._save_cache()
+
     def add_stock(self, symbol: str) -> bool:
         """Add a stock symbol to tracking list."""
         symbol = symbol.upper().strip()
-        if symbol and symbol not in self.stock_symbols:
+        if symbol and symbol not in self._symbol_set:
             self.stock_symbols.append(symbol)
+            self._symbol_set.add(symbol)
             self.save_stock_symbols()
             return True
         return False
-    
+
     def remove_stock(self, symbol: str) -> bool:
         """Remove a stock symbol from tracking list."""
         symbol = symbol.upper().strip()
-        if symbol in self.stock_symbols:
+        if symbol in self._symbol_set:
             self.stock_symbols.remove(symbol)
+            self._symbol_set.discard(symbol)
             self.save_stock_symbols()
             return True
         return False
     
-    def fetch_stock_data_live(self, symbol: str) -> Optional[StockData]:
+    def fetch_stock_data_live(self, symbol: str, now: Optional[datetime] = None) -> Optional[StockData]:
         """
         Fetch live stock data from a free API.
         Using Alpha Vantage's free tier or Yahoo Finance alternative.
@@ -100,11 +193,8 @@ class StockManager:
         try:
             # Using a free API endpoint (Yahoo Finance alternative)
             url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=5)
+
+            response = _SESSION.get(url, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 chart = data['chart']['result'][0]
@@ -122,28 +212,19 @@ class StockManager:
                     price=current_price,
                     change=change,
                     change_percent=change_percent,
-                    last_updated=datetime.now()
+                    last_updated=now or datetime.now()
                 )
         except Exception as e:
             print(f"Error fetching data for {symbol}: {e}")
         
         return None
     
-    def get_mock_data(self, symbol: str) -> StockData:
+    def get_mock_data(self, symbol: str, now: Optional[datetime] = None) -> StockData:
         """Generate mock stock data as fallback."""
-        import random
-        
-        # Base prices for common stocks
-        base_prices = {
-            "AAPL": 185.43, "MSFT": 378.92, "GOOGL": 142.56, "TSLA": 248.73,
-            "AMZN": 144.89, "META": 521.04, "NVDA": 876.45, "NFLX": 452.18,
-            "JPM": 198.76, "V": 289.34
-        }
-        
-        base_price = base_prices.get(symbol, 100.0)
-        
+        base_price = _BASE_PRICES.get(symbol, 100.0)
+
         # Add some random variation
-        price_variation = random.uniform(-0.05, 0.05)  # ±5%
+        price_variation = _RNG.uniform(-0.05, 0.05)  # ±5%
         current_price = base_price * (1 + price_variation)
         
         change = current_price - base_price
@@ -154,35 +235,48 @@ class StockManager:
             price=current_price,
             change=change,
             change_percent=change_percent,
-            last_updated=datetime.now()
+            last_updated=now or datetime.now()
         )
-    
-    def get_stock_data(self, symbol: str, use_cache: bool = True) -> StockData:
+
+    def get_stock_data(self, symbol: str, use_cache: bool = True,
+                       now: Optional[datetime] = None) -> StockData:
         """Get stock data, using cache if available and recent."""
+        # One clock read per call; batch callers pass it in.
+        now = now or datetime.now()
         if use_cache and symbol in self.cache:
             cached = self.cache[symbol]
             # Use cache if less than 1 minute old
-            if datetime.now() - cached.last_updated < timedelta(minutes=1):
+            if now - cached.last_updated < timedelta(minutes=1):
                 return cached
-        
+
         # Try to fetch live data
-        live_data = self.fetch_stock_data_live(symbol)
+        live_data = self.fetch_stock_data_live(symbol, now)
         if live_data:
             self.cache[symbol] = live_data
+            self._note_cache_update()
             return live_data
-        
+
         # Fallback to mock data
-        mock_data = self.get_mock_data(symbol)
+        mock_data = self.get_mock_data(symbol, now)
         self.cache[symbol] = mock_data
+        self._note_cache_update()
         return mock_data
     
     def get_all_stock_data(self, use_cache: bool = True) -> List[StockData]:
-        """Get data for all tracked stocks."""
-        stocks = []
-        for symbol in self.stock_symbols:
-            stock_data = self.get_stock_data(symbol, use_cache)
-            stocks.append(stock_data)
-        return stocks
+        """Get data for all tracked stocks, fetching uncached symbols in parallel."""
+        if not self.stock_symbols:
+            return []
+        # One clock read for the whole batch instead of one per symbol.
+        now = datetime.now()
+        # Each fetch is an independent HTTP call with a 5s timeout, so fan
+        # them out across threads: wall time drops from sum(N) to ~max(N).
+        with ThreadPoolExecutor(max_workers=min(10, len(self.stock_symbols))) as executor:
+            return list(
+                executor.map(
+                    lambda symbol: self.get_stock_data(symbol, use_cache, now),
+                    self.stock_symbols,
+                )
+            )
     
     def refresh_all_data(self) -> List[StockData]:
         """Force refresh all stock data."""
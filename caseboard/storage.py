@@ -1,6 +1,8 @@
 from __future__ import annotations
+from datetime import date
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
 from .data_store import CaseDataStore, CasePayload
 from .models import Case
@@ -9,6 +11,35 @@ from .schema import DeadlinePayload
 DEFAULT_DATA_DIR = Path("data")
 DEFAULT_DATA_FILE = DEFAULT_DATA_DIR / "cases.json"
 
+# Every Case field _to_payload serializes directly; deadlines and the
+# day (next_due depends on which deadlines are still upcoming) are
+# folded into the fingerprint separately.
+_FINGERPRINT_GETTER = attrgetter(
+    "id",
+    "case_number",
+    "case_name",
+    "case_type",
+    "stage",
+    "attention",
+    "status",
+    "paralegal",
+    "current_task",
+    "county",
+    "division",
+    "judge",
+    "opposing_counsel",
+    "opposing_firm",
+    "sol_date",
+)
+
+
+def _payload_fingerprint(case: Case, today_ord: int) -> int:
+    return hash((
+        _FINGERPRINT_GETTER(case),
+        tuple((d.due_date, d.description, d.resolved) for d in case.deadlines),
+        today_ord,
+    ))
+
 
 def _to_payload(case: Case) -> CasePayload:
     deadlines = [
@@ -46,7 +77,7 @@ def load_cases(file_path: Path = DEFAULT_DATA_FILE) -> List[Case]:
     model = store.load()
     cases: List[Case] = []
     for payload in model.cases:
-        case_dict = payload.to_case_dict
+        case_dict = payload.to_case_dict()
         cases.append(Case.from_dict(case_dict))
     return cases
 
@@ -54,5 +85,23 @@ def load_cases(file_path: Path = DEFAULT_DATA_FILE) -> List[Case]:
 def save_cases(cases: Iterable[Case], file_path: Path = DEFAULT_DATA_FILE) -> None:
     store = CaseDataStore(file_path)
     current = store.load(create_backup=False)
-    payloads = [_to_payload(case) for case in cases]
-    store.save(payloads, previous=current)
\ No newline at end of file
+    # Rebuild payloads only for cases whose serialized form changed since
+    # the last save; unchanged cases reuse the on-disk payload as-is.
+    previous_by_id = {payload.id: payload for payload in current.cases}
+    today_ord = date.today().toordinal()
+    payloads: List[CasePayload] = []
+    rebuilt: List[Tuple[Case, int]] = []
+    for case in cases:
+        fingerprint = _payload_fingerprint(case, today_ord)
+        previous = previous_by_id.get(case.id)
+        if previous is not None and fingerprint == case._payload_hash:
+            payloads.append(previous)
+        else:
+            rebuilt.append((case, fingerprint))
+            payloads.append(_to_payload(case))
+    store.save(payloads, previous=current)
+    # Mark cases clean only once the save has landed; committing the
+    # fingerprints before a failed save would make the retry treat the
+    # unsaved changes as already on disk.
+    for case, fingerprint in rebuilt:
+        case._payload_hash = fingerprint
\ No newline at end of file
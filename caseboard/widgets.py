@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from rich.text import Text
 from datetime import date
 from typing import Optional
@@ -7,6 +8,7 @@ from .models import Case
 from .constants import CASE_TYPE_COLOR_MAP, normalize_case_type
 
 
+@lru_cache(maxsize=512)
 def deadline_color(days_until: int) -> str:
     """Return color for deadline based on days until due."""
     if days_until < 0:
@@ -21,14 +23,9 @@ def deadline_color(days_until: int) -> str:
         return "white"
 
 
-def sol_color(sol_date: Optional[date], today: Optional[date] = None) -> str:
-    """Return color for statute of limitations date."""
-    if sol_date is None:
-        return "dim"
-    
-    today = today or date.today()
-    days = (sol_date - today).days
-    
+@lru_cache(maxsize=512)
+def _sol_color_days(days: int) -> str:
+    """Return color for a statute of limitations this many days out."""
     if days < 0:
         return "red"
     elif days <= 30:
@@ -39,8 +36,29 @@ def sol_color(sol_date: Optional[date], today: Optional[date] = None) -> str:
         return "white"
 
 
+def sol_color_ord(sol_ord: Optional[int], today_ord: int) -> str:
+    """Ordinal-based sol_color: a plain int subtraction, no timedelta."""
+    if sol_ord is None:
+        return "dim"
+    return _sol_color_days(sol_ord - today_ord)
+
+
+def sol_color(sol_date: Optional[date], today: Optional[date] = None) -> str:
+    """Return color for statute of limitations date."""
+    if sol_date is None:
+        return "dim"
+
+    today = today or date.today()
+    return _sol_color_days((sol_date - today).days)
+
+
+@lru_cache(maxsize=256)
 def case_type_color(case_type: str) -> str:
-    """Return the configured color for a case type, accounting for legacy labels."""
+    """Return the configured color for a case type, accounting for legacy labels.
+
+    Called once per row on every display render over a tiny keyspace, so
+    the result is memoized.
+    """
     canonical = normalize_case_type(case_type)
     return CASE_TYPE_COLOR_MAP.get(canonical, CASE_TYPE_COLOR_MAP.get("Other", "white"))
 
@@ -48,20 +66,26 @@ def case_type_color(case_type: str) -> str:
 class CaseRow:
     """Represents a formatted case row for display in the table."""
     
-    def __init__(self, case: Case):
+    def __init__(self, case: Case, today: Optional[date] = None):
         self.case = case
-    
+        self.today = today
+
     def __rich__(self) -> Text:
         """Return rich formatted text for the case."""
-        today = date.today()
-        
-        # Build the case info line
-        parts = []
-        
+        # A table loop rendering many rows passes today in once; standalone
+        # use still reads the clock itself.
+        today = self.today or date.today()
+
+        # Append styled spans directly instead of building a markup string
+        # and re-parsing it; this also keeps literal brackets in case data
+        # from being misread as markup.
+        text = Text()
+
         # Case number and name
-        parts.append(f"[bold cyan]{self.case.case_number}[/] ")
-        parts.append(f"[white]{self.case.case_name}[/]")
-        
+        text.append(self.case.case_number, style="bold cyan")
+        text.append(" ")
+        text.append(self.case.case_name, style="white")
+
         # Location info
         location_parts = []
         if self.case.county:
@@ -70,25 +94,39 @@ class CaseRow:
             location_parts.append(self.case.division)
         if self.case.judge:
             location_parts.append(f"Hon. {self.case.judge}")
-        
+
         if location_parts:
-            parts.append(f"\n[dim]  {' • '.join(location_parts)}[/]")
-        
+            text.append("\n")
+            text.append(f"  {' • '.join(location_parts)}", style="dim")
+
         # Stage
         if self.case.stage:
-            parts.append(f" • [blue]{self.case.stage}[/]")
-        
+            text.append(" • ")
+            text.append(self.case.stage, style="blue")
+
+        # Day differences as ordinal subtractions: one int op per date
+        # instead of a timedelta allocation.
+        today_ord = today.toordinal()
+
         # Next deadline
         next_deadline = self.case.next_deadline(today)
         if next_deadline:
-            days = (next_deadline.due_date - today).days
+            days = next_deadline.due_date.toordinal() - today_ord
             color = deadline_color(days)
-            parts.append(f"\n[{color}]  📅 {next_deadline.due_date} - {next_deadline.description}[/]")
-        
+            text.append("\n")
+            text.append(
+                f"  📅 {next_deadline.due_date} - {next_deadline.description}",
+                style=color,
+            )
+
         # Statute of limitations
         if self.case.sol_date:
-            sol_color_name = sol_color(self.case.sol_date, today)
-            days = (self.case.sol_date - today).days
-            parts.append(f"\n[{sol_color_name}]  ⚖️  SOL: {self.case.sol_date} ({days} days)[/]")
-        
-        return Text.from_markup("".join(parts))
\ No newline at end of file
+            days = self.case.sol_date.toordinal() - today_ord
+            sol_color_name = _sol_color_days(days)
+            text.append("\n")
+            text.append(
+                f"  ⚖️  SOL: {self.case.sol_date} ({days} days)",
+                style=sol_color_name,
+            )
+
+        return text
\ No newline at end of file
@@ -8,17 +8,61 @@ Verifies the integrity and setup of the Caseboard application.
 import json
 import sys
 from pathlib import Path
-from collections import Counter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional streaming parser
+    ijson = None
+
+
+def _json_loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _scan_cases_streaming(data_file):
+    """Walk cases.json with ijson, keeping only the ids in memory.
+
+    Returns (schema_version, total_cases, duplicate_counts) without
+    materializing the full object tree — on a big file the footprint is
+    O(ids) instead of O(file).
+    """
+    schema_version = 1
+    total = 0
+    seen = set()
+    duplicate_counts = {}
+    try:
+        with open(data_file, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == 'cases.item' and event == 'start_map':
+                    total += 1
+                elif prefix == 'cases.item.id' and event == 'string' and value:
+                    if value in seen:
+                        duplicate_counts[value] = duplicate_counts.get(value, 1) + 1
+                    else:
+                        seen.add(value)
+                elif prefix == 'schema_version' and event == 'number':
+                    schema_version = int(value)
+    except ijson.JSONError as exc:
+        # Match the stdlib/orjson path: corruption surfaces as ValueError.
+        raise ValueError(str(exc)) from exc
+    return schema_version, total, duplicate_counts
 
 
 def check_python_version():
-    """Check Python version is 3.8+"""
+    """Check Python version is 3.10+"""
     version = sys.version_info
-    if version.major >= 3 and version.minor >= 8:
+    if version.major >= 3 and version.minor >= 10:
         print(f"✓ Python version: {version.major}.{version.minor}.{version.micro}")
         return True
     else:
-        print(f"✗ Python version {version.major}.{version.minor} is too old. Need 3.8+")
+        print(f"✗ Python version {version.major}.{version.minor} is too old. Need 3.10+")
         return False
 
 
@@ -31,32 +75,44 @@ def check_data_file():
         return False
     
     try:
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        schema_version = data.get('schema_version', 1)
-        cases = data.get('cases', [])
-        
+        if ijson is not None:
+            schema_version, total_cases, duplicate_counts = _scan_cases_streaming(data_file)
+        else:
+            data = _json_loads(data_file.read_bytes())
+
+            schema_version = data.get('schema_version', 1)
+            cases = data.get('cases', [])
+            total_cases = len(cases)
+
+            # Check for duplicate IDs in a single pass over the cases
+            seen = set()
+            duplicate_counts = {}
+            for c in cases:
+                case_id = c.get('id')
+                if not case_id:
+                    continue
+                if case_id in seen:
+                    duplicate_counts[case_id] = duplicate_counts.get(case_id, 1) + 1
+                else:
+                    seen.add(case_id)
+
         print(f"✓ data/cases.json is valid JSON")
         print(f"  Schema version: {schema_version}")
-        print(f"  Total cases: {len(cases)}")
-        
-        # Check for duplicate IDs
-        ids = [c.get('id') for c in cases if c.get('id')]
-        id_counts = Counter(ids)
-        duplicates = [id_val for id_val, count in id_counts.items() if count > 1]
-        
-        if duplicates:
-            print(f"  ✗ WARNING: Found {len(duplicates)} duplicate case IDs!")
-            for dup_id in duplicates:
-                print(f"    - {dup_id} appears {id_counts[dup_id]} times")
+        print(f"  Total cases: {total_cases}")
+
+        if duplicate_counts:
+            print(f"  ✗ WARNING: Found {len(duplicate_counts)} duplicate case IDs!")
+            for dup_id, count in duplicate_counts.items():
+                print(f"    - {dup_id} appears {count} times")
             return False
         else:
             print(f"  ✓ All case IDs are unique")
         
         return True
         
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Both json.JSONDecodeError and orjson.JSONDecodeError subclass
+        # ValueError.
         print(f"✗ data/cases.json is corrupted: {e}")
         return False
     except Exception as e:
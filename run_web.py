@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import os
+
 import uvicorn
 
 
 def main() -> None:
-    uvicorn.run("web.main:app", host="127.0.0.1", port=8000, reload=False, log_level="info")
+    # Spread requests across workers; each worker keeps its own read-only
+    # file cache and saves are serialized by the data file lock, so
+    # multiple processes are safe. The event loop and HTTP parser stay on
+    # "auto", which already picks uvloop/httptools from uvicorn[standard]
+    # on platforms that support them.
+    workers = max(2, (os.cpu_count() or 2) // 2)
+    uvicorn.run(
+        "web.main:app",
+        host="127.0.0.1",
+        port=8000,
+        reload=False,
+        workers=workers,
+        log_level="info",
+    )
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 """Setup script to prepare web assets for the Caseboard web dashboard."""
 
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def setup_web_assets():
@@ -18,14 +19,20 @@ def setup_web_assets():
     
     # Copy all PNG files from source to target
     if source_dir.exists():
-        copied_count = 0
-        for png_file in source_dir.rglob("*.png"):
-            target_file = target_dir / png_file.name
-            if not target_file.exists():
-                shutil.copy2(png_file, target_file)
-                copied_count += 1
+        tasks = [
+            (png_file, target_dir / png_file.name)
+            for png_file in source_dir.rglob("*.png")
+            if not (target_dir / png_file.name).exists()
+        ]
+        if tasks:
+            # Copies are pure I/O; fanning them out lets the OS overlap
+            # the reads and writes instead of running them back to back.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda pair: shutil.copy2(*pair), tasks))
+            for png_file, _ in tasks:
                 print(f"  Copied: {png_file.name}")
-        
+        copied_count = len(tasks)
+
         if copied_count == 0:
             print("  All PNG files already present in web/static/pngs/")
         else:
@@ -1,31 +1,93 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Add caseboard module to path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from caseboard.data_store import CaseDataStore
 
+__all__ = ["app"]
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_PATH = BASE_DIR / "data" / "cases.json"
 STATIC_DIR = Path(__file__).resolve().parent / "static"
 
-app = FastAPI(title="Caseboard Web Dashboard", version="1.0.0")
+# One store for the process; rebuilding it per request would redo its
+# lock and focus-log setup every time.
+_STORE = CaseDataStore()
+
+
+def _json_loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Parsed cases.json cached per process, keyed on (mtime_ns, size) so an
+# unchanged file costs one stat instead of a full re-parse per request.
+_cases_cache: tuple[int, int, dict, dict, str] | None = None
+_cases_cache_lock = threading.Lock()
+
+
+def _load_cases_payload() -> tuple[dict, dict, str]:
+    """Return (payload, id -> case index, etag), re-parsing only when the file changed."""
+    global _cases_cache
+    st = DATA_PATH.stat()
+    with _cases_cache_lock:
+        cached = _cases_cache
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3], cached[4]
+        raw = DATA_PATH.read_bytes()
+        payload = _json_loads(raw)
+        index = {
+            case.get("id"): case
+            for case in payload.get("cases", [])
+            if case.get("id")
+        }
+        etag = '"%s"' % hashlib.blake2b(raw, digest_size=16).hexdigest()
+        _cases_cache = (st.st_mtime_ns, st.st_size, payload, index, etag)
+        return payload, index, etag
+
+
+_app_kwargs: dict[str, object] = {}
+if orjson is not None:
+    # Encode responses with orjson too, not just decode the data file.
+    from fastapi.responses import ORJSONResponse
+
+    _app_kwargs["default_response_class"] = ORJSONResponse
+
+app = FastAPI(title="Caseboard Web Dashboard", version="1.0.0", **_app_kwargs)
 
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 
-@app.get("/", response_class=FileResponse)
-async def root() -> FileResponse:
+# The dashboard shell is small and rarely changes; serve it from memory
+# instead of paying an open+read per visit.
+_INDEX_HTML = (STATIC_DIR / "index.html").read_bytes()
+
+
+@app.get("/")
+async def root() -> Response:
     """Serve the main dashboard shell."""
-    return FileResponse(STATIC_DIR / "index.html")
+    return Response(
+        content=_INDEX_HTML,
+        media_type="text/html",
+        headers={"cache-control": "public, max-age=60"},
+    )
 
 
 @app.get("/tv", response_class=FileResponse)
@@ -41,18 +103,22 @@ async def favicon() -> FileResponse:
 
 
 @app.get("/cases")
-async def get_cases() -> dict[str, object]:
+async def get_cases(request: Request) -> Response:
     """Return the raw case data along with a generated timestamp."""
     if not DATA_PATH.exists():
         raise HTTPException(status_code=404, detail="cases.json not found")
 
     try:
-        with DATA_PATH.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+        payload, _, etag = _load_cases_payload()
+    except ValueError as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=500, detail="Invalid cases.json format") from exc
 
-    return {
+    # Pollers send back the last ETag; answer 304 with no body when the
+    # underlying file hasn't changed.
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"etag": etag})
+
+    body = {
         "meta": {
             "version": payload.get("version"),
             "saved_at": payload.get("saved_at"),
@@ -60,6 +126,52 @@ async def get_cases() -> dict[str, object]:
         "cases": payload.get("cases", []),
         "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
     }
+    response_class = _app_kwargs.get("default_response_class", JSONResponse)
+    return response_class(content=body, headers={"etag": etag})
+
+
+@app.get("/cases/focus-history")
+async def get_focus_history_bulk(ids: str) -> dict[str, object]:
+    """Return focus history for several cases in one request.
+
+    A dashboard listing N cases would otherwise issue N per-case
+    requests; one comma-separated ``ids`` query resolves them all
+    against a single parse of the case file.
+    """
+    requested = list(dict.fromkeys(
+        part for part in (piece.strip() for piece in ids.split(",")) if part
+    ))
+    if not requested:
+        raise HTTPException(status_code=400, detail="No case ids given")
+    if not DATA_PATH.exists():
+        raise HTTPException(status_code=404, detail="cases.json not found")
+
+    _, case_index, _ = _load_cases_payload()
+
+    results: dict[str, object] = {}
+    for case_id in requested:
+        case_data = case_index.get(case_id)
+        if not case_data:
+            continue
+        case_number = case_data.get("case_number", "")
+        entries = _STORE.get_focus_history(case_id, case_number)
+        results[case_id] = {
+            "case_number": case_number,
+            "case_name": case_data.get("case_name", ""),
+            "entries": [
+                {
+                    "timestamp": entry.timestamp.isoformat() + "Z",
+                    "focus_text": entry.focus_text,
+                    "actor": entry.actor,
+                }
+                for entry in entries
+            ],
+        }
+
+    return {
+        "cases": results,
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+    }
 
 
 @app.get("/cases/{case_id}/focus-history")
@@ -70,24 +182,16 @@ async def get_focus_history(case_id: str) -> dict[str, object]:
         if not DATA_PATH.exists():
             raise HTTPException(status_code=404, detail="cases.json not found")
         
-        with DATA_PATH.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-        
-        # Find the case
-        case_data = None
-        for case in payload.get("cases", []):
-            if case.get("id") == case_id:
-                case_data = case
-                break
-        
+        _, case_index, _ = _load_cases_payload()
+        case_data = case_index.get(case_id)
+
         if not case_data:
             raise HTTPException(status_code=404, detail="Case not found")
         
         case_number = case_data.get("case_number", "")
         
         # Get focus history
-        store = CaseDataStore()
-        entries = store.get_focus_history(case_id, case_number)
+        entries = _STORE.get_focus_history(case_id, case_number)
         
         # Convert to JSON-serializable format
         history_entries = [